@@ -18,11 +18,20 @@ from .core import (
     extract_key_from_backend_suffix,
     make_suffix_extractor,
 )
-from .discovery import discover_registry_classes, discover_registry_classes_recursive
+from .discovery import (
+    discover_registry_classes,
+    discover_registry_classes_recursive,
+    discover_registry_classes_lazy,
+    iter_discover_registry_classes,
+    iter_discover_registry_classes_recursive,
+    discover_from_entry_points,
+    LazyClassRef,
+    clear_discovery_cache,
+)
 from .cache import RegistryCacheManager
 from .exceptions import RegistryError, DiscoveryError, CacheError
 
-__all__ = [
+__all__ = (
     # Core
     "AutoRegisterMeta",
     "RegistryConfig",
@@ -36,10 +45,16 @@ __all__ = [
     # Discovery
     "discover_registry_classes",
     "discover_registry_classes_recursive",
+    "discover_registry_classes_lazy",
+    "iter_discover_registry_classes",
+    "iter_discover_registry_classes_recursive",
+    "discover_from_entry_points",
+    "LazyClassRef",
+    "clear_discovery_cache",
     # Cache
     "RegistryCacheManager",
     # Exceptions
     "RegistryError",
     "DiscoveryError",
     "CacheError",
-]
+)
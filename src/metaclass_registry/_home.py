@@ -1,15 +1,36 @@
 from __future__ import annotations
 
+import functools
+import os
+import sys
 from pathlib import Path
 
 
+def _windows_home_dir() -> str:
+    """Home directory on Windows: USERPROFILE, falling back to Path.home()."""
+    return os.environ.get('USERPROFILE') or str(Path.home())
+
+
+def _posix_home_dir() -> str:
+    """Home directory on Unix: HOME, falling back to Path.home()."""
+    return os.environ.get('HOME') or str(Path.home())
+
+
+# The platform branch is taken once at import time rather than per call.
+_platform_home_dir = _windows_home_dir if sys.platform == 'win32' else _posix_home_dir
+
+
+@functools.cache
 def get_home_dir() -> str:
     """
     Get the user's home directory in a cross-platform manner.
-    
-    Uses pathlib.Path.home() which works reliably on Unix and Windows.
-    
+
+    Reads USERPROFILE (Windows) or HOME (Unix) and falls back to
+    pathlib.Path.home() when the variable is unset. The implementation is
+    selected once at import time and the result is memoized for the
+    lifetime of the process.
+
     Returns:
         str: The user's home directory path.
     """
-    return str(Path.home())
+    return _platform_home_dir()
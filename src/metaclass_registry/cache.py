@@ -7,8 +7,9 @@ ensuring consistent cache behavior across the codebase.
 
 Architecture:
 - RegistryCacheManager: Generic cache manager for any registry type
-- Supports version validation, age-based invalidation, mtime checking
-- JSON-based serialization with custom serializers/deserializers
+- Supports version validation, age-based invalidation, mtime and content-hash checking
+- JSON (orjson when installed) or msgpack serialization with custom
+  serializers/deserializers
 - XDG-compliant cache locations
 
 Usage:
@@ -29,20 +30,168 @@ Usage:
     )
 """
 
+import atexit
+import base64
+import functools
+import gzip
+import hashlib
 import json
 import logging
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
 import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable, TypeVar, Generic
+from typing import Dict, Any, Optional, Callable, TypeVar, Generic, Iterator, Mapping, Union
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from .exceptions import CacheError
+
 logger = logging.getLogger(__name__)
 
 
+def _json_dumps(data: Dict[str, Any]) -> bytes:
+    """Encode cache data as compact JSON bytes (orjson when available)."""
+    if orjson is not None:
+        # Registries may be keyed by str-Enum members, which stdlib json accepts
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(raw) -> Dict[str, Any]:
+    """Decode JSON bytes (or a memoryview of them) produced by _json_dumps."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    if isinstance(raw, memoryview):
+        raw = raw.tobytes()  # stdlib json only accepts str/bytes
+    return json.loads(raw)
+
+
+def _msgpack_dumps(data: Dict[str, Any]) -> bytes:
+    return msgpack.packb(data, use_bin_type=True)
+
+
+def _msgpack_loads(raw: bytes) -> Dict[str, Any]:
+    return msgpack.unpackb(raw, raw=False)
+
+
+# Cache codecs: name -> (file suffix, encoder, decoder)
+_CODECS: Dict[str, tuple] = {
+    'json': ('.json', _json_dumps, _json_loads),
+    'msgpack': ('.mpack', _msgpack_dumps, _msgpack_loads),
+}
+
+
+def _gzip_compress(payload: bytes) -> bytes:
+    return gzip.compress(payload, compresslevel=6, mtime=0)
+
+
+def _zstd_compress(payload: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=3).compress(payload)
+
+
+def _zstd_decompress(raw) -> bytes:
+    return zstandard.ZstdDecompressor().decompress(raw)
+
+
+# Cache compression: name -> (file suffix, compress, decompress)
+_COMPRESSIONS: Dict[str, tuple] = {
+    'gzip': ('.gz', _gzip_compress, gzip.decompress),
+    'zstd': ('.zst', _zstd_compress, _zstd_decompress),
+}
+
+
+def _compressed_codec(encode: Callable, decode: Callable, compress: Callable, decompress: Callable):
+    """Wrap a codec's encoder/decoder with a compression layer."""
+    def compressed_encode(data: Dict[str, Any]) -> bytes:
+        return compress(encode(data))
+
+    def compressed_decode(raw) -> Dict[str, Any]:
+        try:
+            payload = decompress(raw)
+        except Exception as e:  # gzip/zlib/zstd each raise their own error types
+            raise ValueError(f"Cannot decompress cache data: {e}") from e
+        return decode(payload)
+
+    return compressed_encode, compressed_decode
+
+
+# Errors raised by any codec decoder on a truncated or corrupt file
+_DECODE_ERRORS = (ValueError,)
+
+
+@functools.lru_cache(maxsize=1)
+def _file_mode() -> int:
+    """Mode open() would give a new file under the process umask (read once)."""
+    # os.umask can only be read by setting it, so this is done a single time
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _atomic_write_bytes(path: Path, payload: bytes) -> None:
+    """
+    Write payload to path atomically.
+
+    Data goes to a temp file in the same directory which is then moved
+    over path with os.replace, so readers never see a partially written
+    cache (an interrupted write would otherwise force a full rebuild).
+    The file gets the umask-based mode of a plainly written file rather
+    than mkstemp's 0600.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.chmod(tmp_path, _file_mode())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+@functools.lru_cache(maxsize=None)
+def _get_cache_dir(cache_home: str) -> Path:
+    """Return (creating it on first use) the metaclass-registry dir under cache_home."""
+    cache_dir = Path(cache_home) / 'metaclass-registry'
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
 def get_cache_file_path(cache_name: str) -> Path:
     """
     Get XDG-compliant cache file path.
 
+    The cache directory is created once per cache home per process.
+
     Args:
         cache_name: Name of the cache file
 
@@ -50,30 +199,155 @@ def get_cache_file_path(cache_name: str) -> Path:
         Path to cache file in XDG cache directory
     """
     from . import _home
-    
+
     # Use XDG_CACHE_HOME if set, otherwise default to ~/.cache
-    import os
     cache_home = os.environ.get('XDG_CACHE_HOME')
     if not cache_home:
-        cache_home = Path(_home.get_home_dir()) / '.cache'
-    else:
-        cache_home = Path(cache_home)
+        cache_home = os.path.join(_home.get_home_dir(), '.cache')
 
     # Create metaclass-registry subdirectory
-    cache_dir = cache_home / 'metaclass-registry'
-    cache_dir.mkdir(parents=True, exist_ok=True)
-
-    return cache_dir / cache_name
+    return _get_cache_dir(cache_home) / cache_name
 
 T = TypeVar('T')  # Generic type for cached items
 
+# Managers with unflushed mark_dirty() updates. Weak, so the exit hook does
+# not keep managers alive; an armed flush timer holds its manager until it fires.
+_managers_to_flush: 'weakref.WeakSet[RegistryCacheManager]' = weakref.WeakSet()
+_flush_at_exit_registered = False
+
+
+def _flush_all_at_exit() -> None:
+    """Write pending mark_dirty() updates of every manager at interpreter exit."""
+    for manager in list(_managers_to_flush):
+        manager._flush()
+
+
+def _schedule_flush_at_exit(manager: 'RegistryCacheManager') -> None:
+    """Track manager for the exit flush, registering the atexit hook on first use."""
+    global _flush_at_exit_registered
+    _managers_to_flush.add(manager)
+    if not _flush_at_exit_registered:
+        _flush_at_exit_registered = True
+        atexit.register(_flush_all_at_exit)
+
+
+class _KeyBloomFilter:
+    """
+    Fixed-size Bloom filter over registry keys, stored in the cache header.
+
+    No false negatives: a key that was added always tests as present.
+    Bit positions come from one BLAKE2b digest via double hashing, so the
+    encoding does not depend on optional hash libraries.
+    """
+
+    __slots__ = ('num_bits', 'num_hashes', 'bits')
+
+    def __init__(self, num_bits: int = 2048, num_hashes: int = 3, bits: Optional[bytearray] = None):
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bits if bits is not None else bytearray(num_bits // 8)
+
+    def _positions(self, key: Any) -> Iterator[int]:
+        # Keys hash as they are written to JSON: str subclasses (str-Enum
+        # members) by their string value, anything else (int keys) via str()
+        data = str.encode(key) if isinstance(key, str) else str(key).encode()
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: Any) -> None:
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def update(self, keys) -> None:
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def to_header(self) -> Dict[str, Any]:
+        return {
+            'bits': self.num_bits,
+            'hashes': self.num_hashes,
+            'data': base64.b64encode(bytes(self.bits)).decode('ascii'),
+        }
+
+    @classmethod
+    def from_header(cls, header: Optional[Dict[str, Any]]) -> Optional['_KeyBloomFilter']:
+        if not header:
+            return None
+        try:
+            bits = bytearray(base64.b64decode(header['data']))
+            return cls(header['bits'], header['hashes'], bits)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+# dataclass(slots=...) is only accepted on Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Below this many items a thread pool costs more than it overlaps
+_PARALLEL_DESERIALIZE_MIN_ITEMS = 32
 
-@dataclass
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class CacheConfig:
-    """Configuration for registry caching behavior."""
+    """Configuration for registry caching behavior (immutable and hashable)."""
     max_age_days: int = 7  # Maximum cache age before invalidation
     check_mtimes: bool = False  # Check file modification times
     cache_version: str = "1.0"  # Cache format version
+    flush_delay: float = 5.0  # Seconds to batch mark_dirty() updates before writing
+    compact_threshold: int = 1000  # Append-log entries before folding into the snapshot
+    lazy_items: bool = False  # Deserialize items on first access instead of at load
+    compression: Optional[str] = None  # "gzip" or "zstd" (requires zstandard)
+    parallel: bool = False  # Deserialize large caches on a thread pool (import-heavy items)
+    check_hashes: bool = False  # Check file content hashes (immune to mtime quirks)
+    source_package: Optional[str] = None  # Package whose files' mtimes are digested into the header
+
+
+class LazyCacheItems(Mapping[str, T]):
+    """
+    Read-only mapping of cached items that deserializes each item on first access.
+
+    Returned by RegistryCacheManager.load_cache when CacheConfig.lazy_items is
+    set. For plugin classes this defers the module import per entry until the
+    entry is actually used, so loading N items and touching M costs M imports.
+    Deserialization errors surface on access instead of invalidating the load.
+    """
+
+    def __init__(
+        self,
+        raw_items: Dict[str, Dict[str, Any]],
+        deserializer: Callable[[Dict[str, Any]], T]
+    ):
+        self._raw_items = raw_items
+        self._deserializer = deserializer
+        self._items: Dict[str, T] = {}
+
+    def __getitem__(self, key: str) -> T:
+        try:
+            return self._items[key]
+        except KeyError:
+            pass
+        item = self._deserializer(self._raw_items[key])
+        self._items[key] = item
+        return item
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._raw_items
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw_items)
+
+    def __len__(self) -> int:
+        return len(self._raw_items)
+
+    def materialize_all(self) -> Dict[str, T]:
+        """Deserialize every remaining item and return a plain dict."""
+        return {key: self[key] for key in self._raw_items}
 
 
 class RegistryCacheManager(Generic[T]):
@@ -94,7 +368,9 @@ class RegistryCacheManager(Generic[T]):
         version_getter: Callable[[], str],
         serializer: Callable[[T], Dict[str, Any]],
         deserializer: Callable[[Dict[str, Any]], T],
-        config: Optional[CacheConfig] = None
+        config: Optional[CacheConfig] = None,
+        codec: str = "json",
+        batch_deserializer: Optional[Callable[[Dict[str, Dict[str, Any]]], Dict[str, T]]] = None
     ):
         """
         Initialize cache manager.
@@ -105,47 +381,261 @@ class RegistryCacheManager(Generic[T]):
             serializer: Function to serialize item to JSON-compatible dict
             deserializer: Function to deserialize dict back to item
             config: Optional cache configuration
+            codec: On-disk format: "json" (default, human-readable) or
+                   "msgpack" (requires the msgpack package)
+            batch_deserializer: Optional function that deserializes the whole
+                                items dict at once (e.g. deserialize_plugin_classes);
+                                used instead of per-item calls on eager loads
+
+        Raises:
+            ValueError: If codec or config.compression is not a known name
+            CacheError: If the codec's or compression's optional dependency
+                        is not installed
         """
+        config = config or CacheConfig()
+        if codec not in _CODECS:
+            raise ValueError(
+                f"Unknown cache codec {codec!r}; expected one of {sorted(_CODECS)}"
+            )
+        if codec == 'msgpack' and msgpack is None:
+            raise CacheError("The 'msgpack' cache codec requires the msgpack package")
+        if config.compression is not None and config.compression not in _COMPRESSIONS:
+            raise ValueError(
+                f"Unknown cache compression {config.compression!r}; "
+                f"expected one of {sorted(_COMPRESSIONS)}"
+            )
+        if config.compression == 'zstd' and zstandard is None:
+            raise CacheError("zstd cache compression requires the zstandard package")
+
         self.cache_name = cache_name
         self.version_getter = version_getter
+        self._cached_version = functools.lru_cache(maxsize=1)(version_getter)
         self.serializer = serializer
         self.deserializer = deserializer
-        self.config = config or CacheConfig()
-        self._cache_path = get_cache_file_path(f"{cache_name}.json")
-    
-    def load_cache(self) -> Optional[Dict[str, T]]:
-        """
-        Load cached items with validation.
-        
-        Returns:
-            Dictionary of cached items, or None if cache is invalid
-        """
-        if not self._cache_path.exists():
+        self.batch_deserializer = batch_deserializer
+        self.config = config
+        self.codec = codec
+        suffix, self._encode, self._decode = _CODECS[codec]
+        if config.compression is not None:
+            compression_suffix, compress, decompress = _COMPRESSIONS[config.compression]
+            suffix += compression_suffix
+            self._encode, self._decode = _compressed_codec(
+                self._encode, self._decode, compress, decompress
+            )
+        self._cache_path = get_cache_file_path(f"{cache_name}{suffix}")
+        # Append-only JSON-lines log of incremental updates on top of the snapshot
+        self._log_path = self._cache_path.with_name(f"{self._cache_path.name}.log")
+        self._log_entries = 0
+        # Bloom filter of cached keys; None means "unknown" (answer maybe)
+        self._key_bloom: Optional[_KeyBloomFilter] = None
+        self._key_bloom_checked = False
+
+        # Pending mark_dirty() updates, written by a single delayed _flush()
+        self._pending: Dict[str, T] = {}
+        self._flush_timer: Optional[threading.Timer] = None
+        # Guards the pending updates and every write to the snapshot and log,
+        # since the flush timer writes from its own thread
+        self._lock = threading.Lock()
+
+    def _read_cache_data(self) -> Optional[Dict[str, Any]]:
+        """Read and decode the raw cache file, or None if missing or corrupt."""
+        try:
+            with open(self._cache_path, 'rb') as f:
+                # Decode straight from the page cache instead of copying the
+                # file into a bytes object first
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return self._decode(view)
+        except FileNotFoundError:
             logger.debug(f"No cache found for {self.cache_name}")
             return None
-        
-        try:
-            with open(self._cache_path, 'r') as f:
-                cache_data = json.load(f)
-        except json.JSONDecodeError:
+        except _DECODE_ERRORS:  # mmap of an empty file is a ValueError too
+            # Writes are atomic, but files from older versions or external
+            # truncation can still be corrupt
             logger.warning(f"Corrupt cache file {self._cache_path}, rebuilding")
             self._cache_path.unlink(missing_ok=True)
             return None
-        
+
+    def _source_fields(self, file_mtimes: Optional[Dict[str, float]]) -> Dict[str, Any]:
+        """Build the header fields used to detect source file changes."""
+        fields: Dict[str, Any] = {}
+        if self.config.source_package:
+            # One digest over the whole package instead of a per-file dict
+            if file_mtimes is None:
+                file_mtimes = get_package_file_mtimes(self.config.source_package)
+            fields['source_digest'] = _mtimes_digest(file_mtimes)
+            if self.config.check_hashes:
+                file_hashes = get_file_hashes(file_mtimes)
+                fields['file_hashes'] = file_hashes
+                fields['source_hash'] = _aggregate_digest(file_hashes)
+        elif file_mtimes:
+            fields['file_mtimes'] = file_mtimes
+            if self.config.check_hashes:
+                file_hashes = get_file_hashes(file_mtimes)
+                fields['file_hashes'] = file_hashes
+                fields['source_hash'] = _aggregate_digest(file_hashes)
+        return fields
+
+    def _write_cache_data(
+        self,
+        serialized_items: Dict[str, Dict[str, Any]],
+        source_fields: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Write already-serialized items (plus header) to disk; the caller holds self._lock."""
+        cache_data = {
+            'cache_version': self.config.cache_version,
+            'version': self._cached_version(),
+            'timestamp': time.time(),
+            'items': serialized_items
+        }
+
+        # Add file mtimes/hashes if provided (compact() also passes the
+        # original version and timestamp here)
+        if source_fields:
+            cache_data.update(source_fields)
+
+        try:
+            key_bloom = _KeyBloomFilter()
+            key_bloom.update(serialized_items)
+            cache_data['key_bloom'] = key_bloom.to_header()
+
+            payload = self._encode(cache_data)
+            try:
+                _atomic_write_bytes(self._cache_path, payload)
+            except FileNotFoundError:
+                # get_cache_file_path created the directory; it has been
+                # removed since, so recreate it and retry once
+                self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+                _atomic_write_bytes(self._cache_path, payload)
+            # The snapshot supersedes any appended updates
+            self._log_path.unlink(missing_ok=True)
+            self._log_entries = 0
+            self._key_bloom = key_bloom
+            self._key_bloom_checked = True
+            logger.info(f"💾 Saved {len(serialized_items)} items to {self.cache_name} cache")
+        except Exception as e:
+            logger.warning(f"Failed to save {self.cache_name} cache: {e}")
+
+    def _serialize_items(self, items: Dict[str, T]) -> Dict[str, Dict[str, Any]]:
+        """Serialize items, skipping (and logging) any that fail."""
+        serialized = {}
+        for key, item in items.items():
+            try:
+                serialized[key] = self.serializer(item)
+            except Exception as e:
+                logger.warning(f"Failed to serialize {key} for cache: {e}")
+        return serialized
+
+    def _read_log(self) -> Dict[str, Dict[str, Any]]:
+        """Replay the append-only log into a dict of serialized items."""
+        serialized_items: Dict[str, Dict[str, Any]] = {}
+        entries = 0
+        try:
+            with open(self._log_path, 'rb') as f:
+                for line in f:
+                    try:
+                        serialized_items.update(_json_loads(line))
+                    except ValueError:
+                        # Torn final line from an interrupted append
+                        logger.debug(f"Skipping corrupt log entry in {self._log_path}")
+                        continue
+                    entries += 1
+        except FileNotFoundError:
+            pass
+        self._log_entries = entries
+        return serialized_items
+
+    def _append_serialized(self, serialized_items: Dict[str, Dict[str, Any]]) -> None:
+        """Append serialized items to the log, compacting once it grows too long.
+
+        The caller holds self._lock.
+        """
+        if not serialized_items:
+            return
+        if not self._cache_path.exists():
+            # No snapshot to append to yet. The items alone are not a full
+            # registry, so they are left to the next save_cache()
+            logger.debug(
+                f"No {self.cache_name} cache to append to, skipping {len(serialized_items)} items"
+            )
+            return
+
+        try:
+            with open(self._log_path, 'ab') as f:
+                f.write(b''.join(
+                    _json_dumps({key: data}) + b'\n'
+                    for key, data in serialized_items.items()
+                ))
+        except Exception as e:
+            logger.warning(f"Failed to append to {self.cache_name} cache log: {e}")
+            return
+
+        self._log_entries += len(serialized_items)
+        if self._key_bloom is not None:
+            self._key_bloom.update(serialized_items)
+        if self._log_entries >= self.config.compact_threshold:
+            self._compact()
+
+    def append_item(self, key: str, item: T) -> None:
+        """
+        Add a single item to the cache by appending one log line.
+
+        Unlike save_cache, this does not rewrite the snapshot; the log is
+        replayed by load_cache and folded into the snapshot by compact().
+        Without a snapshot (before the first save_cache) the item is not
+        cached, since a partial registry must not pass as a complete one.
+
+        Args:
+            key: Registry key of the item
+            item: Item to cache
+        """
+        serialized_items = self._serialize_items({key: item})
+        with self._lock:
+            self._append_serialized(serialized_items)
+
+    def compact(self) -> None:
+        """
+        Fold the append-only log into the snapshot file and remove the log.
+
+        The snapshot keeps its original version and timestamp, so compaction
+        never makes a cache look newer than the save it came from. A stale
+        snapshot is left as is (it stays invalid) and the log is discarded.
+        """
+        with self._lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        """compact() body; the caller holds self._lock."""
+        cache_data = self._read_cache_data()
+        if cache_data is None:
+            return
+        if not self._is_valid(cache_data):
+            # Updates on top of a stale snapshot are rebuilt by the next save
+            self._log_path.unlink(missing_ok=True)
+            self._log_entries = 0
+            return
+        serialized_items = cache_data.get('items', {})
+        serialized_items.update(self._read_log())
+        self._write_cache_data(serialized_items, {
+            key: cache_data[key] for key in _PRESERVED_HEADER_FIELDS if key in cache_data
+        })
+
+    def _is_valid(self, cache_data: Dict[str, Any]) -> bool:
+        """Check a decoded cache against versions, age and source files."""
         # Validate cache version
         if cache_data.get('cache_version') != self.config.cache_version:
             logger.debug(f"Cache version mismatch for {self.cache_name}")
-            return None
+            return False
         
         # Validate library/package version
         cached_version = cache_data.get('version', 'unknown')
-        current_version = self.version_getter()
+        current_version = self._cached_version()
         if cached_version != current_version:
             logger.info(
                 f"{self.cache_name} version changed "
                 f"({cached_version} → {current_version}) - cache invalid"
             )
-            return None
+            return False
         
         # Validate cache age
         cache_timestamp = cache_data.get('timestamp', 0)
@@ -154,26 +644,123 @@ class RegistryCacheManager(Generic[T]):
             logger.debug(
                 f"Cache for {self.cache_name} is {cache_age_days:.1f} days old - rebuilding"
             )
-            return None
+            return False
         
         # Validate file mtimes if configured
         if self.config.check_mtimes and 'file_mtimes' in cache_data:
             if not self._validate_mtimes(cache_data['file_mtimes']):
                 logger.debug(f"File modifications detected for {self.cache_name}")
-                return None
+                return False
+
+        # Validate the package mtime digest if configured (also catches added files)
+        if self.config.check_mtimes and 'source_digest' in cache_data:
+            current_mtimes = get_package_file_mtimes(self.config.source_package or '')
+            if _mtimes_digest(current_mtimes) != cache_data['source_digest']:
+                logger.debug(f"Source changes detected for {self.cache_name}")
+                return False
+
+        # Validate file content hashes if configured
+        if self.config.check_hashes and 'source_hash' in cache_data:
+            if not self._validate_hashes(cache_data['file_hashes'], cache_data['source_hash']):
+                logger.debug(f"File content changes detected for {self.cache_name}")
+                return False
+
+        return True
+
+    def _set_key_bloom(
+        self,
+        cache_data: Dict[str, Any],
+        serialized_items: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """Adopt the header's key Bloom filter, extended with log-appended keys."""
+        key_bloom = _KeyBloomFilter.from_header(cache_data.get('key_bloom'))
+        if key_bloom is not None:
+            key_bloom.update(serialized_items)
+        self._key_bloom = key_bloom
+        self._key_bloom_checked = True
+
+    def maybe_contains(self, key: str) -> bool:
+        """
+        Cheap negative lookup against the cached keys.
+
+        Uses the Bloom filter stored in the cache header: False means the
+        key is definitely not in a valid cache, so callers can skip loading
+        or discovery for it. True means "maybe" - including whenever there
+        is no valid cache to answer from.
+
+        Args:
+            key: Registry key to test
+
+        Returns:
+            False if the key is definitely absent, True otherwise
+        """
+        if not self._key_bloom_checked:
+            self._key_bloom_checked = True
+            cache_data = self._read_cache_data()
+            if cache_data is not None and self._is_valid(cache_data):
+                serialized_items = cache_data.get('items', {})
+                if self._log_path.exists():
+                    serialized_items.update(self._read_log())
+                self._set_key_bloom(cache_data, serialized_items)
+
+        if self._key_bloom is None:
+            return True
+        return key in self._key_bloom
+
+    def load_cache(self) -> Optional[Union[Dict[str, T], LazyCacheItems[T]]]:
+        """
+        Load cached items with validation.
         
-        # Deserialize items
-        items = {}
-        for key, item_data in cache_data.get('items', {}).items():
-            try:
-                items[key] = self.deserializer(item_data)
-            except Exception as e:
-                logger.warning(f"Failed to deserialize {key} from cache: {e}")
-                return None  # Invalidate entire cache on any deserialization error
+        Returns:
+            Dictionary of cached items (a LazyCacheItems mapping when
+            config.lazy_items is set), or None if cache is invalid
+        """
+        cache_data = self._read_cache_data()
+        if cache_data is None:
+            return None
+        
+        if not self._is_valid(cache_data):
+            return None
+
+        # Deserialize items (snapshot plus any appended updates)
+        serialized_items = cache_data.get('items', {})
+        if self._log_path.exists():
+            serialized_items.update(self._read_log())
+        self._set_key_bloom(cache_data, serialized_items)
+
+        if self.config.lazy_items:
+            logger.info(
+                f"✅ Loaded {len(serialized_items)} items from {self.cache_name} cache (lazy)"
+            )
+            return LazyCacheItems(serialized_items, self.deserializer)
+
+        try:
+            if self.config.parallel and len(serialized_items) > _PARALLEL_DESERIALIZE_MIN_ITEMS:
+                # Module imports block on disk I/O, so overlapping them pays off
+                with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+                    items = dict(executor.map(self._deserialize_one, serialized_items.items()))
+            elif self.batch_deserializer is not None:
+                items = self.batch_deserializer(serialized_items)
+            else:
+                # Built in one pass from an iterable rather than per-key inserts
+                items = dict(map(self._deserialize_one, serialized_items.items()))
+        except Exception as e:
+            if self.batch_deserializer is not None:
+                logger.warning(f"Failed to deserialize {self.cache_name} cache: {e}")
+            return None  # Invalidate entire cache on any deserialization error
         
         logger.info(f"✅ Loaded {len(items)} items from {self.cache_name} cache")
         return items
     
+    def _deserialize_one(self, entry: tuple) -> tuple:
+        """Deserialize one (key, data) pair, logging the key on failure."""
+        key, item_data = entry
+        try:
+            return key, self.deserializer(item_data)
+        except Exception as e:
+            logger.warning(f"Failed to deserialize {key} from cache: {e}")
+            raise
+
     def save_cache(
         self,
         items: Dict[str, T],
@@ -181,43 +768,69 @@ class RegistryCacheManager(Generic[T]):
     ) -> None:
         """
         Save items to cache.
+
+        This is the explicit bulk path: the whole cache is rewritten once.
+        Use mark_dirty() for per-item updates.
         
         Args:
             items: Dictionary of items to cache
             file_mtimes: Optional dict of file paths to modification times
         """
-        cache_data = {
-            'cache_version': self.config.cache_version,
-            'version': self.version_getter(),
-            'timestamp': time.time(),
-            'items': {}
-        }
-        
-        # Add file mtimes if provided
-        if file_mtimes:
-            cache_data['file_mtimes'] = file_mtimes
-        
-        # Serialize items
-        for key, item in items.items():
-            try:
-                cache_data['items'][key] = self.serializer(item)
-            except Exception as e:
-                logger.warning(f"Failed to serialize {key} for cache: {e}")
-        
-        # Save to disk
-        try:
-            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self._cache_path, 'w') as f:
-                json.dump(cache_data, f, indent=2)
-            logger.info(f"💾 Saved {len(items)} items to {self.cache_name} cache")
-        except Exception as e:
-            logger.warning(f"Failed to save {self.cache_name} cache: {e}")
-    
+        serialized_items = self._serialize_items(items)
+        source_fields = self._source_fields(file_mtimes)
+        with self._lock:
+            self._write_cache_data(serialized_items, source_fields)
+
+    def mark_dirty(self, key: str, item: T) -> None:
+        """
+        Queue a single item for the cache without rewriting it immediately.
+
+        Updates are batched in memory and written by one _flush() after
+        config.flush_delay seconds (or at interpreter exit), so per-item
+        updates during discovery cost one write instead of one write each.
+
+        Args:
+            key: Registry key of the item
+            item: Item to cache
+        """
+        with self._lock:
+            self._pending[key] = item
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.config.flush_delay, self._flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+                _schedule_flush_at_exit(self)
+
+    def _flush(self) -> None:
+        """Append pending mark_dirty() items to the cache log in one write."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            _managers_to_flush.discard(self)
+            pending, self._pending = self._pending, {}
+            if pending:
+                self._append_serialized(self._serialize_items(pending))
+
+    def clear_version_cache(self) -> None:
+        """
+        Forget the memoized version string.
+
+        The version is looked up once per manager; call this in long-running
+        processes where the underlying package may be upgraded or reloaded.
+        """
+        self._cached_version.cache_clear()
+
     def clear_cache(self) -> None:
-        """Clear the cache file."""
-        if self._cache_path.exists():
-            self._cache_path.unlink()
-            logger.info(f"🧹 Cleared {self.cache_name} cache")
+        """Clear the cache file and its append-only log."""
+        with self._lock:
+            self._log_path.unlink(missing_ok=True)
+            self._log_entries = 0
+            self._key_bloom = None
+            self._key_bloom_checked = False
+            if self._cache_path.exists():
+                self._cache_path.unlink()
+                logger.info(f"🧹 Cleared {self.cache_name} cache")
     
     def _validate_mtimes(self, cached_mtimes: Dict[str, float]) -> bool:
         """
@@ -230,17 +843,105 @@ class RegistryCacheManager(Generic[T]):
             True if all mtimes match, False if any file changed
         """
         for file_path, cached_mtime in cached_mtimes.items():
-            path = Path(file_path)
-            if not path.exists():
-                return False  # File was deleted
-            
-            current_mtime = path.stat().st_mtime
+            # One stat() per file; a missing file means it was deleted
+            try:
+                current_mtime = os.stat(file_path).st_mtime
+            except FileNotFoundError:
+                return False
             if abs(current_mtime - cached_mtime) > 1.0:  # 1 second tolerance
                 return False  # File was modified
         
         return True
 
 
+    def _validate_hashes(self, cached_hashes: Dict[str, str], cached_aggregate: str) -> bool:
+        """
+        Validate that file contents haven't changed.
+
+        The files are rehashed and a single aggregate digest is compared;
+        per-file digests are only consulted to report what changed.
+
+        Args:
+            cached_hashes: Dictionary of file paths to cached content hashes
+            cached_aggregate: Aggregate digest over cached_hashes
+
+        Returns:
+            True if all contents match, False if any file changed or was deleted
+        """
+        try:
+            current_hashes = get_file_hashes(cached_hashes)
+        except FileNotFoundError:
+            return False  # File was deleted
+
+        if _aggregate_digest(current_hashes) == cached_aggregate:
+            return True
+
+        if logger.isEnabledFor(logging.DEBUG):
+            changed = [p for p, h in current_hashes.items() if cached_hashes.get(p) != h]
+            logger.debug(f"Changed files for {self.cache_name}: {changed}")
+        return False
+
+
+# Header fields describing the source files a cache was built from
+_SOURCE_FIELDS = ('file_mtimes', 'source_digest', 'file_hashes', 'source_hash')
+
+# Header fields compact() carries over so the rewritten snapshot validates as before
+_PRESERVED_HEADER_FIELDS = ('version', 'timestamp') + _SOURCE_FIELDS
+
+
+def _new_digest():
+    """Return a fresh 64-bit hasher (xxh3 when xxhash is installed, else BLAKE2b)."""
+    if xxhash is not None:
+        return xxhash.xxh3_64()
+    return hashlib.blake2b(digest_size=8)
+
+
+def _digest_name() -> str:
+    return 'xxh3_64' if xxhash is not None else 'blake2b_64'
+
+
+def get_file_hashes(file_paths) -> Dict[str, str]:
+    """
+    Hash the contents of files.
+
+    Args:
+        file_paths: Iterable of file paths
+
+    Returns:
+        Dictionary mapping file paths to hex content digests
+
+    Raises:
+        FileNotFoundError: If a file does not exist
+    """
+    hashes = {}
+    for file_path in file_paths:
+        digest = _new_digest()
+        with open(file_path, 'rb') as f:
+            digest.update(f.read())
+        hashes[file_path] = digest.hexdigest()
+    return hashes
+
+
+def _aggregate_digest(file_hashes: Dict[str, str]) -> str:
+    """Combine per-file digests into one order-independent, algorithm-tagged digest."""
+    digest = _new_digest()
+    for file_path, file_hash in sorted(file_hashes.items()):
+        digest.update(file_path.encode())
+        digest.update(b'\0')
+        digest.update(file_hash.encode())
+        digest.update(b'\n')
+    return f"{_digest_name()}:{digest.hexdigest()}"
+
+
+def _mtimes_digest(file_mtimes: Dict[str, float]) -> str:
+    """Digest a path -> mtime mapping into one algorithm-tagged hex string."""
+    digest = _new_digest()
+    for file_path, mtime in sorted(file_mtimes.items()):
+        digest.update(file_path.encode())
+        digest.update(struct.pack('<d', mtime))
+    return f"{_digest_name()}:{digest.hexdigest()}"
+
+
 # Serializers for metaclass registries (Pattern A)
 
 def serialize_plugin_class(plugin_class: type) -> Dict[str, Any]:
@@ -274,11 +975,65 @@ def deserialize_plugin_class(data: Dict[str, Any]) -> type:
         ImportError: If module cannot be imported
         AttributeError: If class not found in module
     """
-    import importlib
-    
-    module = importlib.import_module(data['module'])
-    plugin_class = getattr(module, data['class_name'])
-    return plugin_class
+    # Cached loads mostly hit modules that are already imported; skip the
+    # import machinery for those
+    module = sys.modules.get(data['module'])
+    if module is None:
+        import importlib
+        module = importlib.import_module(data['module'])
+    return getattr(module, data['class_name'])
+
+
+def deserialize_plugin_classes(serialized_items: Mapping[str, Dict[str, Any]]) -> Dict[str, type]:
+    """
+    Deserialize a whole cache of plugin classes at once.
+
+    Equivalent to calling deserialize_plugin_class() per item, but each
+    distinct module is resolved only once, which matters when many plugins
+    share a module.
+
+    Args:
+        serialized_items: Mapping of cache keys to serialized plugin classes
+
+    Returns:
+        Dictionary of cache keys to reconstructed plugin classes
+
+    Raises:
+        ImportError: If a module cannot be imported
+        AttributeError: If a class is not found in its module
+    """
+    modules: Dict[str, Any] = {}
+    result: Dict[str, type] = {}
+    for key, data in serialized_items.items():
+        module_name = data['module']
+        module = modules.get(module_name)
+        if module is None:
+            module = sys.modules.get(module_name)
+            if module is None:
+                import importlib
+                module = importlib.import_module(module_name)
+            modules[module_name] = module
+        result[key] = getattr(module, data['class_name'])
+    return result
+
+
+def _walk_py_mtimes(root: str):
+    """
+    Yield (path, mtime) for public .py files below root using os.scandir.
+
+    DirEntry objects carry the file type from the directory listing, so
+    only the matching files are stat'ed (once each).
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name != '__pycache__':
+                        stack.append(entry.path)
+                elif name.endswith('.py') and not name.startswith('_'):
+                    yield entry.path, entry.stat().st_mtime
 
 
 def get_package_file_mtimes(package_path: str) -> Dict[str, float]:
@@ -292,18 +1047,12 @@ def get_package_file_mtimes(package_path: str) -> Dict[str, float]:
         Dictionary mapping file paths to modification times
     """
     import importlib
-    from pathlib import Path
     
     try:
         pkg = importlib.import_module(package_path)
-        pkg_dir = Path(pkg.__file__).parent
-        
-        mtimes = {}
-        for py_file in pkg_dir.rglob("*.py"):
-            if not py_file.name.startswith('_'):  # Skip __pycache__, etc.
-                mtimes[str(py_file)] = py_file.stat().st_mtime
-        
-        return mtimes
+        pkg_dir = os.path.dirname(pkg.__file__)
+        # Skip _private.py / __init__.py files
+        return dict(_walk_py_mtimes(pkg_dir))
     except Exception as e:
         logger.warning(f"Failed to get mtimes for {package_path}: {e}")
         return {}
@@ -41,36 +41,201 @@ AutoRegisterMeta uses a configuration-driven approach:
 This maintains domain-specific features while eliminating duplication.
 """
 
+import functools
 import importlib
+import keyword
 import logging
+import operator
+import os
+import re
+import sys
 from abc import ABCMeta
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from typing import Dict, Type, Optional, Callable, Any
+from weakref import WeakKeyDictionary
 
 logger = logging.getLogger(__name__)
 
-# Lazy import to avoid circular dependency
-_registry_cache_manager = None
-
-def _get_cache_manager():
-    """Lazy import of RegistryCacheManager to avoid circular imports."""
-    global _registry_cache_manager
-    if _registry_cache_manager is None:
-        from metaclass_registry.cache import (
-            RegistryCacheManager,
-            CacheConfig,
-            serialize_plugin_class,
-            deserialize_plugin_class,
-            get_package_file_mtimes
+# Registry-name derivation: "StorageBackend" -> "storage backend"
+_CAMEL_RE = re.compile(r'([A-Z])')
+_NAME_SUFFIXES = ('Base', 'Meta', 'Handler', 'Registry')
+
+# Lazy import to avoid circular dependency; bound by _ensure_cache_imported()
+_RegistryCacheManager = None
+_CacheConfig = None
+_serialize_plugin_class = None
+_deserialize_plugin_class = None
+_deserialize_plugin_classes = None
+_get_package_file_mtimes = None
+
+
+def _ensure_cache_imported() -> None:
+    """Lazy import of the cache module's names to avoid circular imports."""
+    global _RegistryCacheManager, _CacheConfig, _serialize_plugin_class
+    global _deserialize_plugin_class, _deserialize_plugin_classes, _get_package_file_mtimes
+    if _RegistryCacheManager is not None:
+        return
+    from metaclass_registry.cache import (
+        RegistryCacheManager,
+        CacheConfig,
+        serialize_plugin_class,
+        deserialize_plugin_class,
+        deserialize_plugin_classes,
+        get_package_file_mtimes
+    )
+    _CacheConfig = CacheConfig
+    _serialize_plugin_class = serialize_plugin_class
+    _deserialize_plugin_class = deserialize_plugin_class
+    _deserialize_plugin_classes = deserialize_plugin_classes
+    _get_package_file_mtimes = get_package_file_mtimes
+    # Assigned last: it is the "already imported" sentinel
+    _RegistryCacheManager = RegistryCacheManager
+
+
+# Subpackage detection results, keyed by the package's __path__ entries.
+# Package layout does not change within a process, so several base classes
+# sharing a discovery package only walk it once.
+_subpackage_cache: Dict[tuple, bool] = {}
+
+
+def _has_subpackages(package_paths) -> bool:
+    """
+    Check whether any directory in package_paths contains a subpackage.
+
+    Uses os.scandir so directory checks come from the listing's cached
+    file type; only candidate subdirectories are probed for __init__.py.
+    Results are memoized per set of paths.
+    """
+    key = tuple(package_paths)
+    try:
+        return _subpackage_cache[key]
+    except KeyError:
+        pass
+    result = _subpackage_cache[key] = _scan_for_subpackages(key)
+    return result
+
+
+def _scan_for_subpackages(package_paths) -> bool:
+    for path in package_paths:
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if (entry.is_dir()
+                            and os.path.isfile(os.path.join(entry.path, '__init__.py'))):
+                        return True
+        except OSError:
+            continue  # Not a real directory (e.g. zip import path)
+    return False
+
+
+def _import_module(name: str) -> Any:
+    """importlib.import_module with a sys.modules fast path for loaded modules."""
+    module = sys.modules.get(name)
+    if module is None:
+        module = importlib.import_module(name)
+    return module
+
+
+def _root_package_version(root_package: str) -> str:
+    """
+    Get a root package's __version__ for cache validation.
+
+    Not memoized here: each cache manager memoizes its version getter, and
+    RegistryCacheManager.clear_version_cache() must reach a fresh lookup.
+    """
+    try:
+        mod = __import__(root_package)
+        return getattr(mod, '__version__', 'unknown')
+    except Exception:
+        return "unknown"
+
+
+# Registry attributes read from a base class, shared by all of its subclasses
+def _derive_registry_name(class_name: str) -> str:
+    """Derive a readable registry name: "StorageBackend" -> "storage backend"."""
+    for suffix in _NAME_SUFFIXES:
+        if class_name.endswith(suffix):
+            class_name = class_name[:-len(suffix)]
+            break
+    # Convert CamelCase to space-separated lowercase
+    return _CAMEL_RE.sub(r' \1', class_name).strip().lower()
+
+
+_inherited_registry_cache: 'WeakKeyDictionary[type, RegistryConfig]' = WeakKeyDictionary()
+
+
+def _inherited_registry_config(base: type) -> 'RegistryConfig':
+    """
+    Build the RegistryConfig a subclass inherits from base.
+
+    Sibling subclasses of the same base resolve to the same (frozen) config,
+    so the attribute lookups and the config itself are built once per base
+    class. Entries go away with the class.
+    """
+    try:
+        return _inherited_registry_cache[base]
+    except KeyError:
+        pass
+    registry_name = getattr(base, '__registry_name__', None)
+    config = RegistryConfig(
+        registry_dict=base.__registry__,
+        key_attribute=getattr(base, '__registry_key__', None),
+        key_extractor=getattr(base, '__key_extractor__', None),
+        skip_if_no_key=getattr(base, '__skip_if_no_key__', True),
+        secondary_registries=getattr(base, '__secondary_registries__', None),
+        registry_name=registry_name if registry_name is not None else _derive_registry_name(base.__name__),
+    )
+    _inherited_registry_cache[base] = config
+    return config
+
+
+# Default discovery functions, keyed by (root package, recursive)
+_discovery_funcs_cache: Dict[tuple, Callable] = {}
+
+
+def _get_discovery_function(root: str, recursive: bool) -> Callable:
+    """
+    Resolve the project's discovery function from <root>.core.registry_discovery.
+
+    Every registry of a project shares the same module, so it is looked up
+    once per (root, recursive) pair. Failed lookups are not cached.
+    """
+    key = (root, recursive)
+    func = _discovery_funcs_cache.get(key)
+    if func is None:
+        mod = _import_module(f"{root}.core.registry_discovery")
+        func = (
+            mod.discover_registry_classes_recursive
+            if recursive
+            else mod.discover_registry_classes
         )
-        _registry_cache_manager = {
-            'RegistryCacheManager': RegistryCacheManager,
-            'CacheConfig': CacheConfig,
-            'serialize_plugin_class': serialize_plugin_class,
-            'deserialize_plugin_class': deserialize_plugin_class,
-            'get_package_file_mtimes': get_package_file_mtimes
-        }
-    return _registry_cache_manager
+        _discovery_funcs_cache[key] = func
+    return func
+
+
+# Per-module reverse index of globals: id(value) -> name
+_module_global_index: 'WeakKeyDictionary[Any, Dict[int, str]]' = WeakKeyDictionary()
+
+
+def _find_module_global(module: Any, value: Any) -> Optional[str]:
+    """
+    Return the name of the module global bound to value, if any.
+
+    The reverse index is built once per module and rebuilt only when it
+    misses or is stale, so wrapping several registries in one module does
+    not rescan its globals each time.
+    """
+    module_vars = vars(module)
+    index = _module_global_index.get(module)
+    if index is not None:
+        name = index.get(id(value))
+        if name is not None and module_vars.get(name) is value:
+            return name
+    index = {}
+    for k, v in module_vars.items():
+        index.setdefault(id(v), k)  # First binding wins, as with a linear scan
+    _module_global_index[module] = index
+    return index.get(id(value))
 
 
 # Type aliases for clarity
@@ -81,6 +246,10 @@ KeyExtractor = Callable[[str, Type], str]
 PRIMARY_KEY = 'primary'
 
 
+def _no_discovery() -> None:
+    """Discovery hook for secondary registries whose primary is a plain dict."""
+
+
 class SecondaryRegistryDict(dict):
     """
     Dict for secondary registries that auto-triggers primary registry discovery.
@@ -89,46 +258,83 @@ class SecondaryRegistryDict(dict):
     which populates both the primary and secondary registries.
     """
 
+    # No per-instance __dict__; __weakref__ keeps instances weak-referenceable
+    __slots__ = (
+        '_primary_registry', '_primary_discover', '_pre_populated', '__weakref__',
+    )
+
     def __init__(self, primary_registry: 'LazyDiscoveryDict'):
         super().__init__()
         self._primary_registry = primary_registry
+        # Resolved once here instead of probing the primary on every access
+        self._primary_discover = getattr(primary_registry, '_discover', None) or _no_discovery
+        # Entries of the plain dict this one replaced, merged in on first access
+        self._pre_populated: Optional[dict] = None
 
     def _ensure_discovered(self):
         """Trigger discovery of primary registry (which populates this secondary registry)."""
-        if hasattr(self._primary_registry, '_discover'):
-            self._primary_registry._discover()
+        # Registries without lazy discovery (plain dicts) count as discovered
+        primary_discovered = getattr(self._primary_registry, '_discovered', True)
+        if not primary_discovered:
+            self._primary_discover()
+            primary_discovered = self._primary_registry._discovered
+        if self._pre_populated:
+            # Registrations made since wrapping take precedence, as they
+            # would have overwritten a copy made at wrap time
+            for key, value in self._pre_populated.items():
+                dict.setdefault(self, key, value)
+        self._pre_populated = None
+        if primary_discovered and type(self) is SecondaryRegistryDict:
+            # Nothing left to trigger: drop the per-access guard. Subclasses
+            # keep their own class (and overrides) and the cheap guard.
+            self.__class__ = _ResolvedSecondaryRegistryDict
 
     def __getitem__(self, key):
         self._ensure_discovered()
-        return super().__getitem__(key)
+        return dict.__getitem__(self, key)
 
     def __contains__(self, key):
         self._ensure_discovered()
-        return super().__contains__(key)
+        return dict.__contains__(self, key)
 
     def __iter__(self):
         self._ensure_discovered()
-        return super().__iter__()
+        return dict.__iter__(self)
 
     def __len__(self):
         self._ensure_discovered()
-        return super().__len__()
+        return dict.__len__(self)
 
     def keys(self):
         self._ensure_discovered()
-        return super().keys()
+        return dict.keys(self)
 
     def values(self):
         self._ensure_discovered()
-        return super().values()
+        return dict.values(self)
 
     def items(self):
         self._ensure_discovered()
-        return super().items()
+        return dict.items(self)
 
     def get(self, key, default=None):
         self._ensure_discovered()
-        return super().get(key, default)
+        return dict.get(self, key, default)
+
+
+class _ResolvedSecondaryRegistryDict(SecondaryRegistryDict):
+    """SecondaryRegistryDict whose primary has been discovered: plain dict access."""
+
+    __slots__ = ()
+
+    __getitem__ = dict.__getitem__
+    __contains__ = dict.__contains__
+    __iter__ = dict.__iter__
+    __len__ = dict.__len__
+    keys = dict.keys
+    values = dict.values
+    items = dict.items
+    get = dict.get
 
 
 class LazyDiscoveryDict(dict):
@@ -139,6 +345,13 @@ class LazyDiscoveryDict(dict):
     Cache is validated against package version and file modification times.
     """
 
+    # No per-instance __dict__; __weakref__ keeps instances weak-referenceable
+    __slots__ = (
+        '_base_class', '_config', '_discovered', '_discovering', '_enable_cache',
+        '_cache_manager', '_cache_requested', '_registration_log',
+        '_secondary_wrappers', '_redirected_configs', '__weakref__',
+    )
+
     def __init__(self, enable_cache: bool = True):
         """
         Initialize lazy discovery dict.
@@ -150,47 +363,112 @@ class LazyDiscoveryDict(dict):
         self._base_class = None
         self._config = None
         self._discovered = False
+        self._discovering = False  # Re-entrancy guard while discovery runs
         self._enable_cache = enable_cache
         self._cache_manager = None
+        self._cache_requested = False
+        # (class name, key) pairs registered during discovery, logged in one record
+        self._registration_log = None
+        # id(plain secondary dict) -> (that dict, the SecondaryRegistryDict replacing it)
+        self._secondary_wrappers: Dict[int, tuple] = {}
+        # id(config) -> (config, config registering into the wrappers)
+        self._redirected_configs: Dict[int, tuple] = {}
+
+    def _drop_guard(self) -> None:
+        """Discovery never runs again, so swap to the guard-free class."""
+        # Only exact instances: a subclass may have overrides (or a layout)
+        # that the resolved class would lose
+        if type(self) is LazyDiscoveryDict:
+            self.__class__ = _ResolvedDiscoveryDict
+
+    def _redirect_secondaries(self, config: 'RegistryConfig') -> 'RegistryConfig':
+        """
+        Return config with wrapped secondary registries swapped for their wrappers.
+
+        Subclass configs still name the plain dicts that were replaced by
+        SecondaryRegistryDict wrappers; registering into those would hide
+        classes defined after the wrapper's first access. Memoized per config.
+        """
+        cached = self._redirected_configs.get(id(config))
+        if cached is not None and cached[0] is config:
+            return cached[1]
+        wrappers = self._secondary_wrappers
+        secondaries = tuple(
+            replace(sec_reg, registry_dict=wrappers[id(sec_reg.registry_dict)][1])
+            if id(sec_reg.registry_dict) in wrappers else sec_reg
+            for sec_reg in config.secondary_registries
+        )
+        redirected = replace(config, secondary_registries=secondaries)
+        self._redirected_configs[id(config)] = (config, redirected)
+        return redirected
 
     def _set_config(self, base_class: Type, config: 'RegistryConfig') -> None:
         self._base_class = base_class
         self._config = config
+        if not config.discovery_package:
+            # Nothing to discover: settle the fast-path flag now
+            self._discovered = True
+            self._drop_guard()
+            return
 
-        # Initialize cache manager if caching is enabled
-        if self._enable_cache and config.discovery_package:
-            try:
-                cache_utils = _get_cache_manager()
-
-                # Get version getter (try to get version from discovery package)
-                def get_version():
-                    try:
-                        # Try to get version from the root package
-                        root_package = config.discovery_package.split('.')[0]
-                        mod = __import__(root_package)
-                        return getattr(mod, '__version__', 'unknown')
-                    except:
-                        return "unknown"
-
-                self._cache_manager = cache_utils['RegistryCacheManager'](
-                    cache_name=f"{config.registry_name.replace(' ', '_')}_registry",
-                    version_getter=get_version,
-                    serializer=cache_utils['serialize_plugin_class'],
-                    deserializer=cache_utils['deserialize_plugin_class'],
-                    config=cache_utils['CacheConfig'](
-                        max_age_days=7,
-                        check_mtimes=True  # Validate file modifications
-                    )
+        # The cache manager itself is created on first discovery
+        self._cache_requested = self._enable_cache
+
+    def _init_cache_manager(self) -> None:
+        """Create the cache manager requested by _set_config."""
+        self._cache_requested = False
+        config = self._config
+        try:
+            _ensure_cache_imported()
+
+            # Version comes from the discovery package's root package
+            root_package = config.discovery_package.split('.')[0]
+
+            self._cache_manager = _RegistryCacheManager(
+                cache_name=f"{config.registry_name.replace(' ', '_')}_registry",
+                version_getter=functools.partial(_root_package_version, root_package),
+                serializer=_serialize_plugin_class,
+                deserializer=_deserialize_plugin_class,
+                batch_deserializer=_deserialize_plugin_classes,
+                config=_CacheConfig(
+                    max_age_days=7,
+                    check_mtimes=True  # Validate file modifications
                 )
-            except Exception as e:
-                logger.debug(f"Failed to initialize cache manager: {e}")
-                self._cache_manager = None
+            )
+        except Exception as e:
+            logger.debug("Failed to initialize cache manager: %s", e)
+            self._cache_manager = None
 
     def _discover(self) -> None:
         """Run discovery once, using cache if available."""
-        if self._discovered or not self._config or not self._config.discovery_package:
+        if self._discovered:
             return
-        self._discovered = True
+        if self._discovering or self._config is None:
+            return  # Re-entrant access during discovery, or not configured yet
+        self._discovering = True
+        self._registration_log = []
+        try:
+            self._run_discovery()
+        finally:
+            self._discovering = False
+            self._discovered = True
+            self._flush_registration_log()
+            self._drop_guard()
+
+    def _flush_registration_log(self) -> None:
+        """Log the classes registered during discovery as a single record."""
+        pending = self._registration_log
+        self._registration_log = None
+        if pending:
+            logger.debug(
+                "Auto-registered %d %ss: %s", len(pending), self._config.registry_name,
+                ", ".join(f"{name} as '{key}'" for name, key in pending)
+            )
+
+    def _run_discovery(self) -> None:
+        """Populate the registry from cache or by importing the discovery package."""
+        if self._cache_requested:
+            self._init_cache_manager()
 
         # Try to load from cache first
         if self._cache_manager:
@@ -198,17 +476,17 @@ class LazyDiscoveryDict(dict):
                 cached_plugins = self._cache_manager.load_cache()
                 if cached_plugins is not None:
                     # Reconstruct registry from cache
-                    self.update(cached_plugins)
+                    dict.update(self, cached_plugins)
                     logger.info(
-                        f"✅ Loaded {len(self)} {self._config.registry_name}s from cache"
+                        "✅ Loaded %d %ss from cache", dict.__len__(self), self._config.registry_name
                     )
                     return
             except Exception as e:
-                logger.debug(f"Cache load failed for {self._config.registry_name}: {e}")
+                logger.debug("Cache load failed for %s: %s", self._config.registry_name, e)
 
         # Cache miss or disabled - perform full discovery
         try:
-            pkg = importlib.import_module(self._config.discovery_package)
+            pkg = _import_module(self._config.discovery_package)
 
             if self._config.discovery_function:
                 self._config.discovery_function(
@@ -218,61 +496,73 @@ class LazyDiscoveryDict(dict):
                 )
             else:
                 root = self._config.discovery_package.split('.')[0]
-                mod = importlib.import_module(f"{root}.core.registry_discovery")
-                func = (
-                    mod.discover_registry_classes_recursive
-                    if self._config.discovery_recursive
-                    else mod.discover_registry_classes
-                )
+                func = _get_discovery_function(root, bool(self._config.discovery_recursive))
                 func(pkg.__path__, f"{self._config.discovery_package}.", self._base_class)
 
-            logger.debug(f"Discovered {len(self)} {self._config.registry_name}s")
+            logger.debug("Discovered %d %ss", dict.__len__(self), self._config.registry_name)
 
             # Save to cache if enabled
             if self._cache_manager:
                 try:
-                    cache_utils = _get_cache_manager()
-                    file_mtimes = cache_utils['get_package_file_mtimes'](
-                        self._config.discovery_package
-                    )
-                    self._cache_manager.save_cache(dict(self), file_mtimes)
+                    file_mtimes = _get_package_file_mtimes(self._config.discovery_package)
+                    self._cache_manager.save_cache(dict(dict.items(self)), file_mtimes)
                 except Exception as e:
-                    logger.debug(f"Failed to save cache for {self._config.registry_name}: {e}")
+                    logger.debug("Failed to save cache for %s: %s", self._config.registry_name, e)
 
         except Exception as e:
-            logger.warning(f"Discovery failed: {e}")
+            logger.warning("Discovery failed: %s", e)
 
     def __getitem__(self, k):
         self._discover()
-        return super().__getitem__(k)
+        return dict.__getitem__(self, k)
 
     def __contains__(self, k):
         self._discover()
-        return super().__contains__(k)
+        return dict.__contains__(self, k)
 
     def __iter__(self):
         self._discover()
-        return super().__iter__()
+        return dict.__iter__(self)
 
     def __len__(self):
         self._discover()
-        return super().__len__()
+        return dict.__len__(self)
 
     def keys(self):
         self._discover()
-        return super().keys()
+        return dict.keys(self)
 
     def values(self):
         self._discover()
-        return super().values()
+        return dict.values(self)
 
     def items(self):
         self._discover()
-        return super().items()
+        return dict.items(self)
 
     def get(self, k, default=None):
         self._discover()
-        return super().get(k, default)
+        return dict.get(self, k, default)
+
+
+class _ResolvedDiscoveryDict(LazyDiscoveryDict):
+    """
+    LazyDiscoveryDict after discovery has run.
+
+    Instances are switched to this class once discovery completes, so lookups
+    go straight to the dict implementation without the discovery guard.
+    """
+
+    __slots__ = ()
+
+    __getitem__ = dict.__getitem__
+    __contains__ = dict.__contains__
+    __iter__ = dict.__iter__
+    __len__ = dict.__len__
+    keys = dict.keys
+    values = dict.values
+    items = dict.items
+    get = dict.get
 
 
 @dataclass(frozen=True)
@@ -299,11 +589,13 @@ class RegistryConfig:
                       is not set. Signature: (class_name: str, cls: Type) -> str
         skip_if_no_key: If True, skip registration when key_attribute is None.
                        If False, require either key_attribute or key_extractor.
-        secondary_registries: Optional list of secondary registry configurations
+        secondary_registries: Optional secondary registry configurations (any
+                             iterable; stored as a tuple)
         log_registration: If True, log debug message when class is registered
         registry_name: Human-readable name for logging (e.g., 'microscope handler')
         discovery_package: Optional package name to auto-discover (e.g., 'openhcs.microscopes')
-        discovery_recursive: If True, use recursive discovery (default: False)
+        discovery_recursive: If True, use recursive discovery. If None (default),
+                            inferred from whether the package has subpackages
 
     Examples:
         # Microscope handlers with name-based key extraction and secondary registry
@@ -343,12 +635,125 @@ class RegistryConfig:
     key_attribute: str
     key_extractor: Optional[KeyExtractor] = None
     skip_if_no_key: bool = False
-    secondary_registries: Optional[list[SecondaryRegistry]] = None
+    secondary_registries: Optional[tuple[SecondaryRegistry, ...]] = None
     log_registration: bool = True
     registry_name: str = "plugin"
     discovery_package: Optional[str] = None  # Auto-inferred from base class module if None
-    discovery_recursive: bool = False
+    discovery_recursive: Optional[bool] = None  # Inferred from package layout if None
     discovery_function: Optional[Callable] = None  # Custom discovery function
+    # Derived: C-level getter for key_attribute, built once per config
+    key_getter: Optional[Callable[[Type], Any]] = field(init=False, repr=False, compare=False)
+    # Derived: compiled register(cls, name) -> key, None if not compilable
+    register_fn: Optional[Callable[[Type, str], Optional[str]]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Accept any iterable (lists are common in class bodies) but store a tuple
+        if self.secondary_registries is not None and not isinstance(self.secondary_registries, tuple):
+            object.__setattr__(self, 'secondary_registries', tuple(self.secondary_registries))
+        key_getter = operator.attrgetter(self.key_attribute) if isinstance(self.key_attribute, str) else None
+        object.__setattr__(self, 'key_getter', key_getter)
+        object.__setattr__(self, 'register_fn', _compile_register(self))
+
+
+def _is_plain_identifier(name: Any) -> bool:
+    return isinstance(name, str) and name.isidentifier() and not keyword.iskeyword(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _register_factory(key_attr: str, has_extractor: bool, secondaries: tuple) -> Optional[Callable]:
+    """
+    Compile a factory for register(cls, name) functions of one registry shape.
+
+    The shape is the key attribute, whether there is a key extractor and the
+    (attr_name, key_source) pair of each secondary registry. Attribute names
+    are inlined as plain attribute accesses; the registries and extractor are
+    factory arguments and never appear in the source. Returns None when a name
+    is not a plain identifier, so the generic registration path is used.
+    """
+    names = [key_attr]
+    for attr, source in secondaries:
+        names.append(attr)
+        if source != PRIMARY_KEY:
+            names.append(source)
+    if not all(_is_plain_identifier(n) for n in names):
+        return None
+
+    params = ''.join(f', secondary_{i}' for i in range(len(secondaries)))
+    lines = [
+        f"def make_register(registry, key_extractor{params}):",
+        "  def register(cls, name):",
+        "    try:",
+        f"        key = cls.{key_attr}",
+        "    except AttributeError:",
+        "        key = None",
+    ]
+    if has_extractor:
+        lines += [
+            "    if key is None:",
+            "        key = key_extractor(name, cls)",
+        ]
+    lines += [
+        "    if key is None:",
+        "        return None",
+        "    registry[key] = cls",
+        f"    cls.{key_attr} = key",
+    ]
+    for i, (attr, source) in enumerate(secondaries):
+        lines += [
+            "    try:",
+            f"        value = cls.{attr}",
+            "    except AttributeError:",
+            "        value = None",
+            "    if value is not None:",
+        ]
+        if source == PRIMARY_KEY:
+            lines.append("        secondary_key = key")
+            pad = " " * 8
+        else:
+            lines += [
+                "        try:",
+                f"            secondary_key = cls.{source}",
+                "        except AttributeError:",
+                "            secondary_key = None",
+                "        if secondary_key is None:",
+                "            logger.warning('Cannot register %s for %s - no %s attribute',",
+                f"                           {attr!r}, cls.__name__, {source!r})",
+                "        else:",
+            ]
+            pad = " " * 12
+        lines += [
+            f"{pad}secondary_{i}[secondary_key] = value",
+            f"{pad}logger.debug(\"Auto-registered %s from %s as '%s'\", {attr!r}, cls.__name__, secondary_key)",
+        ]
+    lines += [
+        "    return key",
+        "  return register",
+    ]
+    namespace: Dict[str, Any] = {'logger': logger}
+    exec(compile("\n".join(lines), f"<register {key_attr}>", 'exec'), namespace)
+    return namespace['make_register']
+
+
+def _compile_register(config: 'RegistryConfig') -> Optional[Callable[[Type, str], Optional[str]]]:
+    """
+    Build the register(cls, name) function specialised for config.
+
+    The function reads the key, falls back to the key extractor, stores the
+    class in the primary and secondary registries and returns the key (None
+    when there is none), as straight-line code with no config lookups.
+    Returns None when the config cannot be compiled.
+    """
+    if not isinstance(config.key_attribute, str):
+        return None
+    secondaries = config.secondary_registries or ()
+    factory = _register_factory(
+        config.key_attribute,
+        config.key_extractor is not None,
+        tuple((s.attr_name, s.key_source) for s in secondaries),
+    )
+    if factory is None:
+        return None
+    return factory(config.registry_dict, config.key_extractor, *(s.registry_dict for s in secondaries))
 
 
 class AutoRegisterMeta(ABCMeta):
@@ -411,50 +816,34 @@ class AutoRegisterMeta(ABCMeta):
 
         # Set up lazy discovery if registry dict supports it (only once for base class)
         if isinstance(registry_config.registry_dict, LazyDiscoveryDict) and not registry_config.registry_dict._config:
-            from dataclasses import replace
+            # Collect config changes and apply them with a single replace()
+            config = registry_config
+            updates: Dict[str, Any] = {}
 
             # Auto-infer discovery_package from base class module if not specified
-            config = registry_config
-            if config.discovery_package is None:
+            discovery_package = config.discovery_package
+            if discovery_package is None:
                 # Extract package from base class module (e.g., 'openhcs.microscopes.microscope_base' → 'openhcs.microscopes')
                 module_parts = new_class.__module__.rsplit('.', 1)
-                inferred_package = module_parts[0] if len(module_parts) > 1 else new_class.__module__
-                # Create new config with inferred package
-                config = replace(config, discovery_package=inferred_package)
-                logger.debug(f"Auto-inferred discovery_package='{inferred_package}' from {new_class.__module__}")
+                discovery_package = module_parts[0] if len(module_parts) > 1 else new_class.__module__
+                updates['discovery_package'] = discovery_package
+                logger.debug("Auto-inferred discovery_package='%s' from %s", discovery_package, new_class.__module__)
 
-            # Auto-infer discovery_recursive based on package structure
+            # Auto-infer discovery_recursive based on package structure, unless
+            # it was set explicitly (then the filesystem is never touched).
             # Check if package has subdirectories with __init__.py (indicating nested structure)
-            if config.discovery_package:
+            if discovery_package and config.discovery_recursive is None:
                 try:
-                    pkg = importlib.import_module(config.discovery_package)
+                    pkg = _import_module(discovery_package)
                     if hasattr(pkg, '__path__'):
-                        import os
-                        has_subpackages = False
-                        for path in pkg.__path__:
-                            if os.path.isdir(path):
-                                # Check if any subdirectories contain __init__.py
-                                for entry in os.listdir(path):
-                                    subdir = os.path.join(path, entry)
-                                    if os.path.isdir(subdir) and os.path.exists(os.path.join(subdir, '__init__.py')):
-                                        has_subpackages = True
-                                        break
-                            if has_subpackages:
-                                break
-
-                        # Only override if discovery_recursive is still at default (False)
-                        # This allows explicit overrides to take precedence
-                        if has_subpackages and not config.discovery_recursive:
-                            config = replace(config, discovery_recursive=True)
-                            logger.debug(f"Auto-inferred discovery_recursive=True for '{config.discovery_package}' (has subpackages)")
-                        elif not has_subpackages and config.discovery_recursive:
-                            logger.debug(f"Keeping explicit discovery_recursive=True for '{config.discovery_package}' (no subpackages detected)")
+                        has_subpackages = _has_subpackages(pkg.__path__)
+                        updates['discovery_recursive'] = has_subpackages
+                        logger.debug("Auto-inferred discovery_recursive=%s for '%s'", has_subpackages, discovery_package)
                 except Exception as e:
-                    logger.debug(f"Failed to auto-infer discovery_recursive: {e}")
+                    logger.debug("Failed to auto-infer discovery_recursive: %s", e)
 
             # Auto-wrap secondary registries with SecondaryRegistryDict
             if config.secondary_registries:
-                import sys
                 wrapped_secondaries = []
                 module = sys.modules.get(new_class.__module__)
 
@@ -463,16 +852,21 @@ class AutoRegisterMeta(ABCMeta):
                     if isinstance(sec_reg.registry_dict, dict) and not isinstance(sec_reg.registry_dict, SecondaryRegistryDict):
                         # Create a new SecondaryRegistryDict wrapping the primary registry
                         wrapped_dict = SecondaryRegistryDict(registry_config.registry_dict)
-                        # Copy any existing entries from the old dict
-                        wrapped_dict.update(sec_reg.registry_dict)
+                        # Existing entries of the old dict are merged on first access
+                        wrapped_dict._pre_populated = sec_reg.registry_dict
 
                         # Find and update the module global variable
-                        if module:
-                            for var_name, var_value in vars(module).items():
-                                if var_value is sec_reg.registry_dict:
-                                    setattr(module, var_name, wrapped_dict)
-                                    logger.debug(f"Auto-wrapped secondary registry '{var_name}' in {new_class.__module__}")
-                                    break
+                        var_name = _find_module_global(module, sec_reg.registry_dict) if module else None
+                        if var_name is None:
+                            # Nobody could reach the wrapper: keep registering into the dict
+                            wrapped_secondaries.append(sec_reg)
+                            continue
+                        setattr(module, var_name, wrapped_dict)
+                        logger.debug("Auto-wrapped secondary registry '%s' in %s", var_name, new_class.__module__)
+                        # Later subclasses register into the wrapper, not the replaced dict
+                        registry_config.registry_dict._secondary_wrappers[id(sec_reg.registry_dict)] = (
+                            sec_reg.registry_dict, wrapped_dict
+                        )
 
                         # Create new SecondaryRegistry with wrapped dict
                         wrapped_sec_reg = SecondaryRegistry(
@@ -484,42 +878,74 @@ class AutoRegisterMeta(ABCMeta):
                     else:
                         wrapped_secondaries.append(sec_reg)
 
-                # Rebuild config with wrapped secondary registries
-                config = replace(config, secondary_registries=wrapped_secondaries)
+                updates['secondary_registries'] = tuple(wrapped_secondaries)
+
+            if updates:
+                config = replace(config, **updates)
 
             registry_config.registry_dict._set_config(new_class, config)
 
-        # Only register concrete classes (not abstract base classes)
-        if not bases or getattr(new_class, '__abstractmethods__', None):
+        # Only register concrete classes (not abstract base classes).
+        # ABCMeta.__new__ always sets __abstractmethods__, so read it directly.
+        if not bases or new_class.__abstractmethods__:
             return new_class
 
-        # Get or derive the registration key
-        key = mcs._get_registration_key(name, new_class, registry_config)
+        registry = registry_config.registry_dict
+        if (registry_config.secondary_registries
+                and isinstance(registry, LazyDiscoveryDict) and registry._secondary_wrappers):
+            registry_config = registry._redirect_secondaries(registry_config)
+
+        register = registry_config.register_fn
+        if register is not None and mcs._uses_default_registration():
+            # Compiled fast path: key lookup, primary and secondary registration
+            key = register(new_class, name)
+            if key is None:
+                return mcs._handle_missing_key(name, registry_config, new_class)
+        else:
+            # Get or derive the registration key
+            key = mcs._get_registration_key(name, new_class, registry_config)
 
-        # Handle missing key
-        if key is None:
-            return mcs._handle_missing_key(name, registry_config, new_class)
+            # Handle missing key
+            if key is None:
+                return mcs._handle_missing_key(name, registry_config, new_class)
 
-        # Register in primary registry
-        mcs._register_class(new_class, key, registry_config)
+            # Register in primary registry
+            mcs._register_class(new_class, key, registry_config)
 
-        # Handle secondary registrations
-        if registry_config.secondary_registries:
-            mcs._register_secondary(new_class, key, registry_config.secondary_registries)
+            # Handle secondary registrations
+            if registry_config.secondary_registries:
+                mcs._register_secondary(new_class, key, registry_config.secondary_registries)
 
         # Log registration if enabled
-        if registry_config.log_registration:
-            logger.debug(f"Auto-registered {name} as '{key}' {registry_config.registry_name}")
+        if registry_config.log_registration and logger.isEnabledFor(logging.DEBUG):
+            registry = registry_config.registry_dict
+            if isinstance(registry, LazyDiscoveryDict) and registry._discovering:
+                # Bulk discovery: reported in one record when it finishes
+                registry._registration_log.append((name, key))
+            else:
+                logger.debug("Auto-registered %s as '%s' %s", name, key, registry_config.registry_name)
 
         return new_class
     
+    @classmethod
+    def _uses_default_registration(mcs) -> bool:
+        """True unless a subclass overrides the registration hooks the compiled path inlines."""
+        return (mcs._get_registration_key is AutoRegisterMeta._get_registration_key
+                and mcs._register_class is AutoRegisterMeta._register_class
+                and mcs._register_secondary is AutoRegisterMeta._register_secondary)
+
     @staticmethod
     def _get_registration_key(name: str, cls: Type, config: RegistryConfig) -> Optional[str]:
         """Get the registration key for a class (explicit or derived)."""
         # Try explicit key first
-        key = getattr(cls, config.key_attribute, None)
-        if key is not None:
-            return key
+        key_getter = config.key_getter
+        if key_getter is not None:
+            try:
+                key = key_getter(cls)
+            except AttributeError:
+                key = None
+            if key is not None:
+                return key
 
         # Try key extractor if provided
         if config.key_extractor is not None:
@@ -532,7 +958,7 @@ class AutoRegisterMeta(ABCMeta):
         """Handle case where no registration key is available."""
         if config.skip_if_no_key:
             if config.log_registration:
-                logger.debug(f"Skipping registration for {name} - no {config.key_attribute}")
+                logger.debug("Skipping registration for %s - no %s", name, config.key_attribute)
             return new_class  # Return the class, just don't register it
         else:
             raise ValueError(
@@ -562,29 +988,27 @@ class AutoRegisterMeta(ABCMeta):
             # This takes priority over creating a new registry
             for base in new_class.__mro__[1:]:  # Skip self
                 if hasattr(base, '__registry__'):
-                    registry_dict = base.__registry__
-                    key_attribute = getattr(base, '__registry_key__', None)
-                    key_extractor = getattr(base, '__key_extractor__', None)
-                    skip_if_no_key = getattr(base, '__skip_if_no_key__', True)
-                    secondary_registries = getattr(base, '__secondary_registries__', None)
-                    registry_name = getattr(base, '__registry_name__', None)
-                    break
-            else:
-                # No parent registry found - check if class explicitly defines __registry_key__
-                # (only create new registry if __registry_key__ is in the class body, not inherited)
-                key_attribute = attrs.get('__registry_key__')
-                if key_attribute is not None:
-                    # Auto-create registry dict and store on the class
-                    registry_dict = LazyDiscoveryDict()
-                    new_class.__registry__ = registry_dict
-
-                    # Get other optional attributes from class
-                    key_extractor = attrs.get('__key_extractor__')
-                    skip_if_no_key = attrs.get('__skip_if_no_key__', True)
-                    secondary_registries = attrs.get('__secondary_registries__')
-                    registry_name = attrs.get('__registry_name__')
-                else:
-                    return None  # No registry configuration found
+                    return _inherited_registry_config(base)
+
+            # No parent registry found - check if class explicitly defines __registry_key__
+            # (only create new registry if __registry_key__ is in the class body, not inherited)
+            key_attribute = attrs.get('__registry_key__')
+            if key_attribute is None:
+                return None  # No registry configuration found
+
+            # Auto-create registry dict and store on the class
+            registry_dict = LazyDiscoveryDict()
+            new_class.__registry__ = registry_dict
+
+            # Get other optional attributes from class
+            key_extractor = attrs.get('__key_extractor__')
+            skip_if_no_key = attrs.get('__skip_if_no_key__', True)
+            secondary_registries = attrs.get('__secondary_registries__')
+            registry_name = attrs.get('__registry_name__')
+            if registry_name is None:
+                # Not stored on the class: subclasses derive their own name from
+                # their base (memoized in _inherited_registry_config)
+                registry_name = _derive_registry_name(new_class.__name__)
         else:
             # Old style: get from metaclass
             key_attribute = getattr(mcs, '__registry_key__', '_registry_key')
@@ -592,21 +1016,11 @@ class AutoRegisterMeta(ABCMeta):
             skip_if_no_key = getattr(mcs, '__skip_if_no_key__', True)
             secondary_registries = getattr(mcs, '__secondary_registries__', None)
             registry_name = getattr(mcs, '__registry_name__', None)
+            if registry_name is None:
+                registry_name = _derive_registry_name(new_class.__name__)
 
-        # Auto-derive registry name if not provided
-        if registry_name is None:
-            # Derive from class name: "StorageBackend" → "storage backend"
-            clean_name = new_class.__name__
-            for suffix in ['Base', 'Meta', 'Handler', 'Registry']:
-                if clean_name.endswith(suffix):
-                    clean_name = clean_name[:-len(suffix)]
-                    break
-            # Convert CamelCase to space-separated lowercase
-            import re
-            registry_name = re.sub(r'([A-Z])', r' \1', clean_name).strip().lower()
-
-        logger.debug(f"Auto-configured registry for {new_class.__name__}: "
-                    f"key_attribute={key_attribute}, registry_name={registry_name}")
+        logger.debug("Auto-configured registry for %s: key_attribute=%s, registry_name=%s",
+                     new_class.__name__, key_attribute, registry_name)
 
         return RegistryConfig(
             registry_dict=registry_dict,
@@ -627,7 +1041,7 @@ class AutoRegisterMeta(ABCMeta):
     def _register_secondary(
         cls: Type,
         primary_key: str,
-        secondary_registries: list[SecondaryRegistry]
+        secondary_registries: tuple[SecondaryRegistry, ...]
     ) -> None:
         """Handle secondary registry registrations."""
         for sec_reg in secondary_registries:
@@ -642,18 +1056,24 @@ class AutoRegisterMeta(ABCMeta):
                 secondary_key = getattr(cls, sec_reg.key_source, None)
                 if secondary_key is None:
                     logger.warning(
-                        f"Cannot register {sec_reg.attr_name} for {cls.__name__} - "
-                        f"no {sec_reg.key_source} attribute"
+                        "Cannot register %s for %s - no %s attribute",
+                        sec_reg.attr_name, cls.__name__, sec_reg.key_source
                     )
                     continue
 
             # Register in secondary registry
             sec_reg.registry_dict[secondary_key] = value
-            logger.debug(f"Auto-registered {sec_reg.attr_name} from {cls.__name__} as '{secondary_key}'")
+            logger.debug("Auto-registered %s from %s as '%s'", sec_reg.attr_name, cls.__name__, secondary_key)
 
 
 # Helper functions for common key extraction patterns
 
+@functools.lru_cache(maxsize=1024)
+def _extract_cached(name: str, suffix: str) -> str:
+    """Strip suffix from a class name and lowercase it; depends only on the name."""
+    return name.removesuffix(suffix).lower()
+
+
 def make_suffix_extractor(suffix: str) -> KeyExtractor:
     """
     Create a key extractor that removes a suffix from class names.
@@ -671,12 +1091,9 @@ def make_suffix_extractor(suffix: str) -> KeyExtractor:
         extract_backend = make_suffix_extractor('Backend')
         extract_backend('DiskStorageBackend', cls) -> 'diskstorage'
     """
-    suffix_len = len(suffix)
-
-    def extractor(name: str, cls: Type) -> str:
-        if name.endswith(suffix):
-            return name[:-suffix_len].lower()
-        return name.lower()
+    # Bound as a default so the body reads a fast local instead of a closure cell
+    def extractor(name: str, cls: Type, _suffix: str = suffix) -> str:
+        return _extract_cached(name, _suffix)
 
     return extractor
 
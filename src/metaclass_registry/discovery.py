@@ -11,23 +11,532 @@ This module eliminates ~70 lines of duplicated pkgutil + importlib boilerplate
 by providing a single, well-tested discovery function.
 """
 
+import ast
+import functools
 import importlib
-import inspect
+import importlib.machinery
+import importlib.util
 import logging
-import pkgutil
+import os
+import re
+import sys
 from collections.abc import Iterable
-from typing import Callable, List, Optional, Set, Type
+from dataclasses import dataclass
+from types import ModuleType
+from weakref import WeakKeyDictionary
+from typing import TYPE_CHECKING, Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Type
+
+if TYPE_CHECKING:
+    from .cache import RegistryCacheManager
 
 logger = logging.getLogger(__name__)
 
+# Directory listings for the recursive walk:
+# path -> (mtime, candidate subdirectories, their mtimes, [(name, ispkg)])
+_DIR_CACHE: Dict[str, Tuple[int, Tuple[str, ...], tuple, List[Tuple[str, bool]]]] = {}
 
-def discover_registry_classes(
+# pkgutil.iter_modules results: (paths, prefix) ->
+# (directory mtimes, candidate subdirectories, their mtimes, [(module_name, ispkg)])
+_ITER_CACHE: Dict[Tuple[Tuple[str, ...], str], Tuple[tuple, Tuple[str, ...], tuple, List[Tuple[str, bool]]]] = {}
+
+# validation_func results: validation_func -> {class: passed}. Both levels are
+# weakly keyed so neither predicates nor plugin classes are kept alive.
+_VALIDATION_CACHE: 'WeakKeyDictionary[Callable, WeakKeyDictionary[Type, bool]]' = WeakKeyDictionary()
+
+
+def clear_discovery_cache() -> None:
+    """Forget cached package listings and lazily loaded classes (e.g. between tests)."""
+    _ITER_CACHE.clear()
+    _DIR_CACHE.clear()
+    _VALIDATION_CACHE.clear()
+    _entry_points.cache_clear()
+    _materialise.cache_clear()
+
+
+def _dir_mtimes(paths: Tuple[str, ...]) -> tuple:
+    """Modification times of the package directories; None for unreadable paths."""
+    mtimes = []
+    for path in paths:
+        try:
+            mtimes.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+def _candidate_subdirs(paths: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Identifier-named subdirectories of paths: the ones that can become packages."""
+    subdirs = []
+    for path in paths:
+        try:
+            with os.scandir(path) as entries:
+                subdirs.extend(
+                    entry.path for entry in entries
+                    if entry.is_dir() and entry.name.isidentifier()
+                )
+        except OSError:
+            continue  # Not a real directory (e.g. zip import path)
+    return tuple(subdirs)
+
+
+def _iter_modules_cached(package_path: Iterable[str], package_prefix: str) -> List[Tuple[str, bool]]:
+    """
+    pkgutil.iter_modules as a list of (module_name, ispkg), cached per package.
+
+    Adding, removing or renaming a module changes its directory's mtime;
+    adding or removing a subdirectory's __init__.py changes that
+    subdirectory's mtime. Either invalidates the cached listing.
+    """
+    paths = tuple(package_path)
+    key = (paths, package_prefix)
+    mtimes = _dir_mtimes(paths)
+    cached = _ITER_CACHE.get(key)
+    if cached is not None and cached[0] == mtimes and _dir_mtimes(cached[1]) == cached[2]:
+        return cached[3]
+    import pkgutil  # Deferred: only needed once a package is actually scanned
+    subdirs = _candidate_subdirs(paths)
+    sub_mtimes = _dir_mtimes(subdirs)
+    modules = [
+        (module_name, ispkg)
+        for _, module_name, ispkg in pkgutil.iter_modules(paths, package_prefix)
+    ]
+    _ITER_CACHE[key] = (mtimes, subdirs, sub_mtimes, modules)
+    return modules
+
+
+def _list_directory(path: str, mtime: int) -> List[Tuple[str, bool]]:
+    """
+    Sorted (name, ispkg) for the importable modules and packages in a directory.
+
+    Cached per directory until its mtime, or the mtime of one of its candidate
+    subdirectories (which changes when an __init__.py is added or removed),
+    changes. Each file is matched against the import system's suffixes
+    (source, bytecode and extension modules).
+    """
+    cached = _DIR_CACHE.get(path)
+    if cached is not None and cached[0] == mtime and _dir_mtimes(cached[1]) == cached[2]:
+        return cached[3]
+
+    suffixes = sorted(importlib.machinery.all_suffixes(), key=len, reverse=True)
+    found: Dict[str, bool] = {}
+    subdirs: List[str] = []
+    sub_mtimes: list = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir():
+                if name.isidentifier():
+                    # Stat before probing so a concurrent change invalidates the entry
+                    subdirs.append(entry.path)
+                    sub_mtimes.extend(_dir_mtimes((entry.path,)))
+                    if os.path.isfile(os.path.join(entry.path, '__init__.py')):
+                        found[name] = True
+                continue
+            for suffix in suffixes:
+                if name.endswith(suffix):
+                    modname = name[:-len(suffix)]
+                    if modname != '__init__' and modname.isidentifier():
+                        found.setdefault(modname, False)
+                    break
+
+    listing = sorted(found.items())
+    _DIR_CACHE[path] = (mtime, tuple(subdirs), tuple(sub_mtimes), listing)
+    return listing
+
+
+def _log_walk_error(package_name: str) -> None:
+    """pkgutil.walk_packages onerror callback: the package could not be imported."""
+    logger.debug("Could not import package %s while walking", package_name)
+
+
+def _walk_modules(package_path: Iterable[str], package_prefix: str, seen: Optional[Set[str]] = None):
+    """
+    Yield (module_name, ispkg) for every module below the package directories.
+
+    Packages are yielded before their contents, as pkgutil.walk_packages
+    does. Like pkgutil, a name found under several path entries (e.g. the
+    portions of a namespace package) is only yielded - and walked - for the
+    first one. Path entries that are not directories (e.g. zip archives)
+    fall back to pkgutil.walk_packages.
+    """
+    if seen is None:
+        seen = set()
+    for path in package_path:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+            listing = _list_directory(path, mtime)
+        except (NotADirectoryError, FileNotFoundError):
+            import pkgutil
+            # onerror: packages that fail to import are logged and skipped
+            # (without it, non-ImportError failures would abort the walk)
+            for _, modname, ispkg in pkgutil.walk_packages(
+                [path], prefix=package_prefix, onerror=_log_walk_error
+            ):
+                if modname not in seen:
+                    seen.add(modname)
+                    yield modname, ispkg
+            continue
+        except OSError as e:
+            logger.debug("Could not list package directory %s: %s", path, e)
+            continue
+        for name, ispkg in listing:
+            modname = package_prefix + name
+            if modname in seen:
+                continue
+            seen.add(modname)
+            yield modname, ispkg
+            if ispkg:
+                yield from _walk_modules([os.path.join(path, name)], modname + '.', seen)
+
+
+def _memoized_validator(validation_func: Callable[[Type], bool]) -> Callable[[Type], bool]:
+    """
+    Wrap validation_func so each class is only validated once per process.
+
+    Predicates that cannot be weakly referenced (e.g. callable objects whose
+    class defines __slots__ without __weakref__) are returned unchanged.
+    """
+    try:
+        results = _VALIDATION_CACHE.get(validation_func)
+        if results is None:
+            results = _VALIDATION_CACHE[validation_func] = WeakKeyDictionary()
+    except TypeError:
+        return validation_func
+
+    def validate(cls: Type) -> bool:
+        try:
+            return results[cls]
+        except KeyError:
+            passed = results[cls] = bool(validation_func(cls))
+            return passed
+
+    return validate
+
+
+def _scan_module(
+    module: ModuleType,
+    module_name: str,
+    base_class: Type,
+    validation_func: Optional[Callable[[Type], bool]],
+    defined_here: bool = True
+) -> List[Type]:
+    """
+    Collect the subclasses of base_class found in an imported module.
+
+    This is the inner loop of every discovery function, so attribute and
+    global lookups are bound to locals up front.
+
+    Args:
+        module: The imported module
+        module_name: Its fully qualified name
+        base_class: Base class to filter for
+        validation_func: Optional predicate a class must satisfy
+        defined_here: If True, skip classes imported from other modules
+
+    Returns:
+        Matching public (non-underscore) classes, in module namespace order
+    """
+    found: List[Type] = []
+    append = found.append
+    debug = logger.debug if logger.isEnabledFor(logging.DEBUG) else None
+    isinstance_, type_ = isinstance, type
+    # Iterate a snapshot of the namespace rather than dir() + getattr():
+    # no sorting, no attribute lookups, and module __getattr__ hooks
+    # (PEP 562 lazy attributes) are never triggered
+    for name, obj in tuple(vars(module).items()):
+        # Private names (and module dunders) are never registry classes
+        if name[:1] == '_':
+            continue
+        if not isinstance_(obj, type_):
+            continue
+
+        # Only include classes defined in this module (not imported)
+        if defined_here and obj.__module__ != module_name:
+            continue
+
+        # Filter for subclasses of base_class (real inheritance only:
+        # an MRO lookup never dispatches to ABC __subclasscheck__)
+        if base_class not in obj.__mro__ or obj is base_class:
+            continue
+
+        # Apply optional validation function
+        if validation_func is not None and not validation_func(obj):
+            if debug is not None:
+                debug("Validation failed for %s", obj.__name__)
+            continue
+
+        if debug is not None:
+            debug("Discovered registry class: %s from %s", obj.__name__, module_name)
+        append(obj)
+    return found
+
+
+def _preimport_modules(module_names: List[str]) -> None:
+    """
+    Import modules concurrently so their file reads overlap.
+
+    Failures are ignored here: the serial scan imports each module again
+    (a sys.modules hit on success) and reports errors as usual. Scanning
+    stays serial so results keep their order.
+    """
+    module_names = [name for name in module_names if name not in sys.modules]
+    if len(module_names) < 2:
+        return
+
+    def preimport(module_name: str) -> None:
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            pass
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(8, len(module_names))) as executor:
+        list(executor.map(preimport, module_names))
+
+
+def _exclusion_filter(exclude_modules: Optional[Set[str]]) -> Optional[Callable[[str], bool]]:
+    """
+    Build a predicate matching module names that contain any excluded substring.
+
+    The common case, an exclusion equal to the module's last name segment, is
+    a set lookup; other substrings are matched by one compiled alternation.
+    Predicates are memoized per set of exclusions, since every scan of a
+    registry passes the same ones.
+
+    Returns:
+        The predicate, or None when nothing is excluded
+    """
+    if not exclude_modules:
+        return None
+    return _compiled_exclusion_filter(frozenset(exclude_modules))
+
+
+@functools.lru_cache(maxsize=128)
+def _compiled_exclusion_filter(leaves: FrozenSet[str]) -> Callable[[str], bool]:
+    """Build the _exclusion_filter predicate for a frozen set of exclusions."""
+    search = re.compile('|'.join(map(re.escape, sorted(leaves)))).search
+
+    def is_excluded(module_name: str) -> bool:
+        return module_name.rpartition('.')[2] in leaves or search(module_name) is not None
+
+    return is_excluded
+
+
+def _load_cached_classes(cache: 'RegistryCacheManager') -> Optional[List[Type]]:
+    """Return a previously saved discovery result, or None if there is no valid one."""
+    try:
+        cached = cache.load_cache()
+    except Exception as e:
+        logger.debug("Discovery cache load failed: %s", e)
+        return None
+    if cached is None:
+        return None
+    return list(cached.values())
+
+
+def _save_cached_classes(cache: 'RegistryCacheManager', package_prefix: str, classes: List[Type]) -> None:
+    """Save a discovery result along with the package's file mtimes."""
+    from .cache import get_package_file_mtimes
+
+    try:
+        file_mtimes = get_package_file_mtimes(package_prefix.rstrip('.'))
+        cache.save_cache(
+            {f"{cls.__module__}.{cls.__qualname__}": cls for cls in classes},
+            file_mtimes,
+        )
+    except Exception as e:
+        logger.debug("Failed to save discovery cache: %s", e)
+
+
+def _candidate_modules(
+    entries: Iterable[Tuple[str, bool]],
+    exclude_modules: Optional[Set[str]],
+    skip_packages: bool
+) -> Iterator[str]:
+    """Yield the module names from (name, ispkg) entries that should be scanned."""
+    is_excluded = _exclusion_filter(exclude_modules)
+    debug = logger.debug
+    for module_name, ispkg in entries:
+        # Skip packages if requested
+        if ispkg and skip_packages:
+            continue
+
+        # Skip excluded modules
+        if is_excluded is not None and is_excluded(module_name):
+            debug("Skipping excluded module: %s", module_name)
+            continue
+
+        yield module_name
+
+
+def _collect_from_modules(
+    module_names: Iterable[str],
+    base_class: Type,
+    validation_func: Optional[Callable[[Type], bool]],
+    defined_here: bool
+) -> Iterator[Type]:
+    """
+    Import each module in turn and yield the registry classes found in it.
+
+    Modules are only imported as the generator is advanced, so a consumer
+    that stops early never imports the rest of the package.
+    """
+    if validation_func is not None:
+        validation_func = _memoized_validator(validation_func)
+
+    for module_name in module_names:
+        try:
+            module = sys.modules.get(module_name) or importlib.import_module(module_name)
+            found = _scan_module(module, module_name, base_class, validation_func, defined_here)
+        except ImportError as e:
+            # Skip modules that can't be imported (e.g., missing optional dependencies)
+            logger.debug("Could not import module %s: %s", module_name, e)
+            continue
+        except Exception as e:
+            # Log unexpected errors but continue discovery
+            logger.warning("Failed to load registry module %s: %s", module_name, e)
+            continue
+        yield from found
+
+
+def iter_discover_registry_classes(
     package_path: Iterable[str],
     package_prefix: str,
     base_class: Type,
     exclude_modules: Optional[Set[str]] = None,
     validation_func: Optional[Callable[[Type], bool]] = None,
     skip_packages: bool = True
+) -> Iterator[Type]:
+    """
+    Generator version of discover_registry_classes.
+
+    Modules are imported one at a time as classes are requested, so
+    ``next(iter_discover_registry_classes(...), None)`` stops importing as
+    soon as the first match is found. There is no cache or parallel option
+    because both need the complete result up front.
+
+    Args:
+        package_path: Package __path__ attribute to scan
+        package_prefix: Module prefix for importlib
+        base_class: Base class to filter for
+        exclude_modules: Set of module name substrings to skip
+        validation_func: Optional function to validate discovered classes
+        skip_packages: If True, skip package directories (default: True)
+
+    Returns:
+        Iterator over discovered registry classes
+    """
+    module_names = _candidate_modules(
+        _iter_modules_cached(package_path, package_prefix), exclude_modules, skip_packages
+    )
+    return _collect_from_modules(module_names, base_class, validation_func, defined_here=True)
+
+
+def iter_discover_registry_classes_recursive(
+    package_path: Iterable[str],
+    package_prefix: str,
+    base_class: Type,
+    exclude_modules: Optional[Set[str]] = None,
+    validation_func: Optional[Callable[[Type], bool]] = None
+) -> Iterator[Type]:
+    """
+    Generator version of discover_registry_classes_recursive.
+
+    Both the package walk and the module imports advance lazily.
+
+    Args:
+        package_path: Package __path__ attribute to scan
+        package_prefix: Module prefix for importlib
+        base_class: Base class to filter for
+        exclude_modules: Set of module name substrings to skip
+        validation_func: Optional function to validate discovered classes
+
+    Returns:
+        Iterator over discovered registry classes
+    """
+    module_names = _candidate_modules(
+        _walk_modules(package_path, package_prefix), exclude_modules, skip_packages=True
+    )
+    return _collect_from_modules(module_names, base_class, validation_func, defined_here=False)
+
+
+@functools.lru_cache(maxsize=None)
+def _entry_points(group: str) -> tuple:
+    """Entry points registered under group, read from installed metadata once."""
+    from importlib import metadata
+
+    try:
+        return tuple(metadata.entry_points(group=group))
+    except TypeError:
+        # Python 3.9: entry_points() takes no arguments and returns a dict
+        return tuple(metadata.entry_points().get(group, ()))
+
+
+def discover_from_entry_points(
+    group: str,
+    base_class: Type,
+    validation_func: Optional[Callable[[Type], bool]] = None
+) -> List[Type]:
+    """
+    Discover registry classes advertised as entry points.
+
+    Installed distributions can register plugins without being scanned,
+    e.g. in pyproject.toml::
+
+        [project.entry-points."openhcs.storage_backends"]
+        zarr = "openhcs_zarr.backend:ZarrStorageBackend"
+
+    Entry point metadata is read once per group and memoized until
+    clear_discovery_cache() is called. Each entry point is loaded (importing
+    its module) and kept if it is a subclass of base_class.
+
+    Args:
+        group: Entry point group name
+        base_class: Base class to filter for
+        validation_func: Optional function to validate discovered classes
+
+    Returns:
+        List of discovered registry classes, in entry point order
+    """
+    registry_classes = []
+    for entry_point in _entry_points(group):
+        try:
+            obj = entry_point.load()
+        except ImportError as e:
+            logger.debug("Could not load entry point %s: %s", entry_point.name, e)
+            continue
+        except Exception as e:
+            logger.warning("Failed to load entry point %s: %s", entry_point.name, e)
+            continue
+
+        if not isinstance(obj, type) or obj is base_class or base_class not in obj.__mro__:
+            logger.debug(
+                "Entry point %s is not a %s subclass", entry_point.name, base_class.__name__
+            )
+            continue
+        if validation_func is not None and not validation_func(obj):
+            logger.debug("Validation failed for %s", obj.__name__)
+            continue
+        registry_classes.append(obj)
+
+    logger.debug(
+        "Discovered %d registry classes for %s from entry points %r",
+        len(registry_classes), base_class.__name__, group
+    )
+    return registry_classes
+
+
+def discover_registry_classes(
+    package_path: Iterable[str],
+    package_prefix: str,
+    base_class: Type,
+    exclude_modules: Optional[Set[str]] = None,
+    validation_func: Optional[Callable[[Type], bool]] = None,
+    skip_packages: bool = True,
+    cache: Optional['RegistryCacheManager'] = None,
+    parallel: bool = False,
+    entry_point_group: Optional[str] = None
 ) -> List[Type]:
     """
     Generic registry class discovery using pkgutil + importlib pattern.
@@ -45,6 +554,14 @@ def discover_registry_classes(
         validation_func: Optional function to validate discovered classes
                         Should return True to include, False to exclude
         skip_packages: If True, skip package directories (default: True)
+        cache: Optional RegistryCacheManager (using serialize_plugin_class /
+               deserialize_plugin_class) to return a previous result from
+               instead of scanning, and to store a fresh result in
+        parallel: If True, import the candidate modules on a thread pool
+                  before scanning them (helps when imports wait on disk I/O)
+        entry_point_group: Optional entry point group to try first (see
+                           discover_from_entry_points); the package is only
+                           scanned if the group yields no classes
         
     Returns:
         List of discovered registry classes
@@ -61,64 +578,43 @@ def discover_registry_classes(
         >>> print([b.__name__ for b in backends])
         ['DiskStorageBackend', 'MemoryStorageBackend', 'ZarrStorageBackend']
     """
-    registry_classes = []
-    exclude_modules = exclude_modules or set()
-    
+    if entry_point_group is not None:
+        registry_classes = discover_from_entry_points(
+            entry_point_group, base_class, validation_func
+        )
+        if registry_classes:
+            return registry_classes
+
+    if cache is not None:
+        cached = _load_cached_classes(cache)
+        if cached is not None:
+            return cached
+
     logger.debug(
-        f"Discovering registry classes: base={base_class.__name__}, "
-        f"prefix={package_prefix}, exclude={exclude_modules}"
+        "Discovering registry classes: base=%s, prefix=%s, exclude=%s",
+        base_class.__name__, package_prefix, exclude_modules
     )
-    
-    for importer, module_name, ispkg in pkgutil.iter_modules(package_path, package_prefix):
-        # Skip packages if requested
-        if ispkg and skip_packages:
-            continue
-            
-        # Skip excluded modules
-        if any(excluded in module_name for excluded in exclude_modules):
-            logger.debug(f"Skipping excluded module: {module_name}")
-            continue
-            
-        try:
-            # Import the module
-            module = importlib.import_module(module_name)
-            
-            # Find all classes in the module
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                # Filter for subclasses of base_class
-                if not issubclass(obj, base_class):
-                    continue
-                    
-                # Exclude the base class itself
-                if obj is base_class:
-                    continue
-                    
-                # Only include classes defined in this module (not imported)
-                if obj.__module__ != module_name:
-                    continue
-                    
-                # Apply optional validation function
-                if validation_func and not validation_func(obj):
-                    logger.debug(f"Validation failed for {obj.__name__}")
-                    continue
-                    
-                logger.debug(f"Discovered registry class: {obj.__name__} from {module_name}")
-                registry_classes.append(obj)
-                    
-        except ImportError as e:
-            # Skip modules that can't be imported (e.g., missing optional dependencies)
-            logger.debug(f"Could not import module {module_name}: {e}")
-            continue
-        except Exception as e:
-            # Log unexpected errors but continue discovery
-            logger.warning(f"Failed to load registry module {module_name}: {e}")
-            continue
-    
-    logger.info(
-        f"Discovered {len(registry_classes)} registry classes for {base_class.__name__}: "
-        f"{[cls.__name__ for cls in registry_classes]}"
+
+    module_names = list(_candidate_modules(
+        _iter_modules_cached(package_path, package_prefix), exclude_modules, skip_packages
+    ))
+    if parallel:
+        _preimport_modules(module_names)
+
+    registry_classes = list(
+        _collect_from_modules(module_names, base_class, validation_func, defined_here=True)
     )
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Discovered %d registry classes for %s: %s",
+            len(registry_classes), base_class.__name__,
+            [cls.__name__ for cls in registry_classes]
+        )
     
+    if cache is not None:
+        _save_cached_classes(cache, package_prefix, registry_classes)
+
     return registry_classes
 
 
@@ -127,13 +623,17 @@ def discover_registry_classes_recursive(
     package_prefix: str,
     base_class: Type,
     exclude_modules: Optional[Set[str]] = None,
-    validation_func: Optional[Callable[[Type], bool]] = None
+    validation_func: Optional[Callable[[Type], bool]] = None,
+    cache: Optional['RegistryCacheManager'] = None,
+    parallel: bool = False
 ) -> List[Type]:
     """
     Recursive version of discover_registry_classes that walks entire package tree.
     
-    Uses pkgutil.walk_packages instead of iter_modules to recursively scan
-    all subpackages. Useful for deeply nested registry structures.
+    Walks the package directories with os.scandir, descending into every
+    subdirectory that has an __init__.py. Unlike pkgutil.walk_packages,
+    intermediate packages are not imported just to find their __path__.
+    Useful for deeply nested registry structures.
     
     Args:
         package_path: Package __path__ attribute to scan
@@ -142,6 +642,8 @@ def discover_registry_classes_recursive(
         base_class: Base class to filter for
         exclude_modules: Set of module name substrings to skip
         validation_func: Optional function to validate discovered classes
+        cache: Optional RegistryCacheManager, as for discover_registry_classes
+        parallel: If True, import the candidate modules on a thread pool first
         
     Returns:
         List of discovered registry classes
@@ -156,66 +658,196 @@ def discover_registry_classes_recursive(
         ...     exclude_modules={'base'}
         ... )
     """
-    registry_classes = []
-    exclude_modules = exclude_modules or set()
-    
+    if cache is not None:
+        cached = _load_cached_classes(cache)
+        if cached is not None:
+            return cached
+
     logger.debug(
-        f"Discovering registry classes (recursive): base={base_class.__name__}, "
-        f"prefix={package_prefix}, exclude={exclude_modules}"
+        "Discovering registry classes (recursive): base=%s, prefix=%s, exclude=%s",
+        base_class.__name__, package_prefix, exclude_modules
     )
+
+    # Walk through all modules in the package tree (packages themselves are skipped)
+    modnames = list(_candidate_modules(
+        _walk_modules(package_path, package_prefix), exclude_modules, skip_packages=True
+    ))
+    if parallel:
+        _preimport_modules(modnames)
+
+    # Classes imported into a module count too, not only those defined there
+    registry_classes = list(
+        _collect_from_modules(modnames, base_class, validation_func, defined_here=False)
+    )
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Discovered %d registry classes (recursive) for %s: %s",
+            len(registry_classes), base_class.__name__,
+            [cls.__name__ for cls in registry_classes]
+        )
     
-    # Walk through all modules in the package tree
-    for importer, modname, ispkg in pkgutil.walk_packages(package_path, prefix=package_prefix):
-        # Skip packages (only process modules)
-        if ispkg:
+    if cache is not None:
+        _save_cached_classes(cache, package_prefix, registry_classes)
+
+    return registry_classes
+
+
+
+@functools.lru_cache(maxsize=None)
+def _materialise(module_name: str, class_name: str) -> Type:
+    """Import module_name and return its class_name attribute (memoized)."""
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+@dataclass(frozen=True)
+class LazyClassRef:
+    """
+    Placeholder for a discovered class whose module has not been imported yet.
+
+    Attributes:
+        module_name: Fully qualified module defining the class
+        class_name: Name of the class within that module
+    """
+    module_name: str
+    class_name: str
+
+    @property
+    def path(self) -> str:
+        """The reference as a "module:ClassName" string."""
+        return f"{self.module_name}:{self.class_name}"
+
+    def load(self) -> Type:
+        """Import the defining module (once) and return the class."""
+        return _materialise(self.module_name, self.class_name)
+
+
+def _base_names(node: ast.ClassDef) -> Optional[Tuple[str, ...]]:
+    """Textual names of a class's bases, or None if any base is not a plain name."""
+    names = []
+    for base in node.bases:
+        if isinstance(base, ast.Name):
+            names.append(base.id)
+        elif isinstance(base, ast.Attribute):
+            names.append(base.attr)
+        else:
+            return None  # e.g. class X(make_base()): needs the real import
+    return tuple(names)
+
+
+def _scan_class_defs(module_name: str) -> Optional[List[Tuple[str, Tuple[str, ...]]]]:
+    """
+    List (class_name, base_names) for top-level classes in a module's source.
+
+    Returns None when the source cannot be inspected statically (no .py
+    origin, unreadable or invalid source, or computed base classes).
+    """
+    try:
+        spec = importlib.util.find_spec(module_name)
+        origin = spec.origin if spec is not None else None
+        if not origin or not origin.endswith('.py'):
+            return None
+        with open(origin, 'rb') as f:
+            tree = ast.parse(f.read(), filename=origin)
+    except (ImportError, OSError, SyntaxError, ValueError):
+        return None
+
+    classes = []
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            bases = _base_names(node)
+            if bases is None:
+                return None
+            classes.append((node.name, bases))
+    return classes
+
+
+def _import_and_scan(module_name: str, base_class: Type) -> List[LazyClassRef]:
+    """Eager fallback for modules that cannot be inspected statically."""
+    try:
+        module = sys.modules.get(module_name) or importlib.import_module(module_name)
+    except Exception as e:
+        logger.debug("Could not import module %s: %s", module_name, e)
+        return []
+    refs = []
+    append = refs.append
+    isinstance_, type_ = isinstance, type
+    for name, obj in tuple(vars(module).items()):
+        if name[:1] == '_':
             continue
-            
-        # Skip excluded modules
-        if any(excluded in modname for excluded in exclude_modules):
-            logger.debug(f"Skipping excluded module: {modname}")
+        if (isinstance_(obj, type_) and obj.__module__ == module_name
+                and obj is not base_class and base_class in obj.__mro__):
+            append(LazyClassRef(module_name, name))
+    return refs
+
+
+def discover_registry_classes_lazy(
+    package_path: Iterable[str],
+    package_prefix: str,
+    base_class: Type,
+    exclude_modules: Optional[Set[str]] = None,
+    skip_packages: bool = True
+) -> List[LazyClassRef]:
+    """
+    Discover registry classes without importing the modules that define them.
+
+    Module sources are parsed with ast and top-level classes whose bases name
+    base_class (directly, or through another class found the same way) are
+    returned as LazyClassRef placeholders; call .load() to import one.
+    Modules that cannot be inspected statically (compiled extensions, invalid
+    source, computed bases) are imported and scanned like
+    discover_registry_classes does.
+
+    Matching is by name, so a candidate may turn out not to subclass
+    base_class when loaded; there is no validation_func because it would
+    need the class object.
+
+    Args:
+        package_path: Package __path__ attribute to scan
+        package_prefix: Module prefix for importlib (e.g., "openhcs.io.")
+        base_class: Base class to filter for
+        exclude_modules: Set of module name substrings to skip
+        skip_packages: If True, skip package directories (default: True)
+
+    Returns:
+        List of LazyClassRef placeholders, in discovery order
+    """
+    exclude_modules = exclude_modules or set()
+    is_excluded = _exclusion_filter(exclude_modules)
+    scanned: List[Tuple[str, Optional[List[Tuple[str, Tuple[str, ...]]]]]] = []
+
+    for module_name, ispkg in _iter_modules_cached(package_path, package_prefix):
+        if ispkg and skip_packages:
             continue
-            
-        try:
-            # Import the module
-            module = importlib.import_module(modname)
-            
-            # Find all classes in the module
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                
-                # Check if it's a class
-                if not isinstance(attr, type):
-                    continue
-                    
-                # Check if it's a subclass of base_class
-                if not issubclass(attr, base_class):
-                    continue
-                    
-                # Exclude the base class itself
-                if attr is base_class:
-                    continue
-                    
-                # Apply optional validation function
-                if validation_func and not validation_func(attr):
-                    logger.debug(f"Validation failed for {attr.__name__}")
-                    continue
-                    
-                logger.debug(f"Discovered registry class: {attr.__name__} from {modname}")
-                registry_classes.append(attr)
-                    
-        except ImportError as e:
-            # Skip modules that can't be imported
-            logger.debug(f"Could not import module {modname}: {e}")
+        if is_excluded is not None and is_excluded(module_name):
             continue
-        except Exception as e:
-            # Log unexpected errors but continue discovery
-            logger.warning(f"Failed to load registry module {modname}: {e}")
+        scanned.append((module_name, _scan_class_defs(module_name)))
+
+    # Grow the set of matching class names until it stops changing, so that
+    # subclasses of discovered classes are found regardless of module order
+    matching_names = {base_class.__name__}
+    matched: Set[Tuple[str, str]] = set()
+    changed = True
+    while changed:
+        changed = False
+        for module_name, classes in scanned:
+            for class_name, bases in classes or ():
+                key = (module_name, class_name)
+                if key not in matched and matching_names.intersection(bases):
+                    matched.add(key)
+                    matching_names.add(class_name)
+                    changed = True
+
+    refs: List[LazyClassRef] = []
+    for module_name, classes in scanned:
+        if classes is None:
+            refs.extend(_import_and_scan(module_name, base_class))
             continue
-    
-    logger.info(
-        f"Discovered {len(registry_classes)} registry classes (recursive) for {base_class.__name__}: "
-        f"{[cls.__name__ for cls in registry_classes]}"
-    )
-    
-    return registry_classes
+        refs.extend(
+            LazyClassRef(module_name, class_name)
+            for class_name, _ in classes
+            if (module_name, class_name) in matched and class_name[:1] != '_'
+        )
 
+    logger.debug("Lazily discovered %d registry classes for %s", len(refs), base_class.__name__)
+    return refs
@@ -1,10 +1,36 @@
 """Pytest configuration and fixtures for metaclass_registry tests."""
 
+import importlib.machinery
 import sys
 from pathlib import Path
 
 import pytest
 
+from metaclass_registry import _home
+from metaclass_registry.core import PRIMARY_KEY, SecondaryRegistry
+from metaclass_registry.discovery import clear_discovery_cache
+
+# Same loaders, in the same order, as the default path hook's FileFinder
+_LOADER_DETAILS = (
+    (importlib.machinery.ExtensionFileLoader, importlib.machinery.EXTENSION_SUFFIXES),
+    (importlib.machinery.SourceFileLoader, importlib.machinery.SOURCE_SUFFIXES),
+    (importlib.machinery.SourcelessFileLoader, importlib.machinery.BYTECODE_SUFFIXES),
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_cache_home(tmp_path_factory):
+    """
+    Point XDG_CACHE_HOME at a session directory.
+
+    Registries created by the tests cache their discoveries; this keeps
+    those files out of the user's cache and, under pytest-xdist, gives every
+    worker its own cache files (tmp_path_factory is per worker).
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('XDG_CACHE_HOME', str(tmp_path_factory.mktemp('cache_home')))
+        yield
+
 
 @pytest.fixture(autouse=True)
 def reset_registries():
@@ -20,6 +46,103 @@ def reset_registries():
     to_remove = [key for key in sys.modules.keys() if 'test_pkg' in key]
     for key in to_remove:
         del sys.modules[key]
+    clear_discovery_cache()
+    # get_home_dir is memoized; tests may change HOME/USERPROFILE
+    _home.get_home_dir.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def plugin_package_root(tmp_path_factory):
+    """Session-wide directory holding the packages made by plugin_package_factory."""
+    return tmp_path_factory.mktemp("plugin_packages")
+
+
+@pytest.fixture(scope="session")
+def plugin_package_factory(plugin_package_root):
+    """
+    Build importable test packages once per session.
+
+    Call it with a package name and a {filename: source} dict; an empty
+    __init__.py is added. Asking for the same package again returns the
+    existing directory without rewriting it, so its __pycache__ is reused.
+    Packages are read-only: tests that modify files should use tmp_path.
+    Import them with the isolated_sys_modules fixture active.
+
+    Returns:
+        Callable (name, files) -> package directory
+    """
+    created = {}
+
+    def make(name, files):
+        spec = frozenset(files.items())
+        pkg_dir = plugin_package_root / name
+        if name in created:
+            if created[name] != spec:
+                raise ValueError(f"Test package {name!r} already exists with different files")
+            return pkg_dir
+        pkg_dir.mkdir()
+        (pkg_dir / "__init__.py").write_text("")
+        for filename, source in files.items():
+            path = pkg_dir / filename
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(source)
+        created[name] = spec
+        return pkg_dir
+
+    return make
+
+
+@pytest.fixture
+def isolated_sys_modules(tmp_path, plugin_package_root):
+    """
+    Put tmp_path and the session package root on sys.path for the test.
+
+    sys.modules is snapshotted on setup; on teardown only the modules added
+    since then are checked, and those loaded from either directory are
+    removed. Standard library or package modules first imported during the
+    test stay loaded, so their classes keep a single identity across tests.
+    """
+    roots = (str(tmp_path), str(plugin_package_root))
+    before = set(sys.modules)
+    sys.path[:0] = roots
+    for root in roots:
+        # Prime the finder so the first import skips the sys.path_hooks probe
+        sys.path_importer_cache[root] = importlib.machinery.FileFinder(root, *_LOADER_DETAILS)
+    yield tmp_path
+    for root in roots:
+        sys.path.remove(root)
+        sys.path_importer_cache.pop(root, None)
+    for name in set(sys.modules) - before:
+        # Read the namespace directly: test modules may define __getattr__
+        namespace = getattr(sys.modules[name], '__dict__', {})
+        locations = [namespace.get('__file__') or '', *namespace.get('__path__', ())]
+        if any(location.startswith(roots) for location in locations):
+            del sys.modules[name]
+
+
+@pytest.fixture
+def make_secondary():
+    """
+    Build primary-keyed SecondaryRegistry configs.
+
+    Call it with the secondary registry dict and optionally attr_name
+    (default 'handler_class'). Within a test, the same dict and attr_name
+    return the same instance; each test gets its own instances.
+    """
+    built = {}
+
+    def make(registry_dict, attr_name='handler_class'):
+        key = (id(registry_dict), attr_name)
+        if key not in built:
+            # The dict is kept alongside so its id cannot be reused meanwhile
+            built[key] = (registry_dict, SecondaryRegistry(
+                registry_dict=registry_dict,
+                key_source=PRIMARY_KEY,
+                attr_name=attr_name,
+            ))
+        return built[key][1]
+
+    return make
 
 
 @pytest.fixture
@@ -1,8 +1,10 @@
 """Tests for metaclass_registry.cache module."""
 
 import json
+import sys
 import tempfile
 import time
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -14,6 +16,7 @@ from metaclass_registry.cache import (
     get_cache_file_path,
     serialize_plugin_class,
     deserialize_plugin_class,
+    deserialize_plugin_classes,
     get_package_file_mtimes,
 )
 
@@ -76,6 +79,13 @@ class TestCacheConfig:
         assert config.check_mtimes is True
         assert config.cache_version == "2.0"
 
+    def test_config_is_frozen_and_hashable(self):
+        """Test CacheConfig cannot be mutated and can be used as a key."""
+        config = CacheConfig()
+        with pytest.raises(FrozenInstanceError):
+            config.max_age_days = 1
+        assert hash(config) == hash(CacheConfig())
+
 
 class TestSerializeDeserializePluginClass:
     """Test plugin class serialization and deserialization."""
@@ -117,13 +127,38 @@ class TestSerializeDeserializePluginClass:
         finally:
             del globals()['RoundtripPlugin']
 
+    def test_deserialize_skips_import_for_loaded_module(self):
+        """Test already-imported modules are taken from sys.modules."""
+        data = {'module': 'json', 'class_name': 'JSONDecoder', 'qualname': 'JSONDecoder'}
+        with patch('importlib.import_module') as import_module:
+            assert deserialize_plugin_class(data) is json.JSONDecoder
+        import_module.assert_not_called()
+
+    def test_deserialize_plugin_classes_bulk(self):
+        """Test bulk deserialization resolves every item."""
+        items = {
+            'decoder': {'module': 'json', 'class_name': 'JSONDecoder', 'qualname': 'JSONDecoder'},
+            'encoder': {'module': 'json', 'class_name': 'JSONEncoder', 'qualname': 'JSONEncoder'},
+            'dict': {'module': 'builtins', 'class_name': 'dict', 'qualname': 'dict'},
+        }
+        assert deserialize_plugin_classes(items) == {
+            'decoder': json.JSONDecoder,
+            'encoder': json.JSONEncoder,
+            'dict': dict,
+        }
+
+    def test_deserialize_imports_missing_module(self):
+        """Test modules not yet imported still go through importlib."""
+        data = {'module': 'no_such_module_xyz', 'class_name': 'X', 'qualname': 'X'}
+        with pytest.raises(ImportError):
+            deserialize_plugin_class(data)
+
 
 class TestGetPackageFileMtimes:
     """Test get_package_file_mtimes function."""
 
-    def test_get_mtimes_for_package(self, tmp_path):
+    def test_get_mtimes_for_package(self, tmp_path, isolated_sys_modules):
         """Test getting modification times for package files."""
-        import sys
         import importlib
 
         # Create a test package
@@ -132,26 +167,37 @@ class TestGetPackageFileMtimes:
         (pkg_dir / '__init__.py').write_text('# init')
         (pkg_dir / 'module.py').write_text('# module')
 
-        sys.path.insert(0, str(tmp_path))
-        try:
-            # Import package
-            importlib.import_module('test_mtime_pkg')
+        # Import package
+        importlib.import_module('test_mtime_pkg')
 
-            # Get mtimes
-            mtimes = get_package_file_mtimes('test_mtime_pkg')
+        # Get mtimes
+        mtimes = get_package_file_mtimes('test_mtime_pkg')
 
-            # Should have files (may include __init__.py, module.py)
-            assert len(mtimes) >= 1
+        # Should have files (may include __init__.py, module.py)
+        assert len(mtimes) >= 1
 
-            # All values should be floats (timestamps)
-            for path, mtime in mtimes.items():
-                assert isinstance(mtime, float)
-                assert mtime > 0
+        # All values should be floats (timestamps)
+        for path, mtime in mtimes.items():
+            assert isinstance(mtime, float)
+            assert mtime > 0
 
-        finally:
-            sys.path.remove(str(tmp_path))
-            if 'test_mtime_pkg' in sys.modules:
-                del sys.modules['test_mtime_pkg']
+    def test_get_mtimes_nested_and_private_files(self, tmp_path, isolated_sys_modules):
+        """Test that subpackages are walked and underscore files are skipped."""
+        import importlib
+
+        pkg_dir = tmp_path / 'test_mtime_nested_pkg'
+        sub_dir = pkg_dir / 'sub'
+        sub_dir.mkdir(parents=True)
+        (pkg_dir / '__init__.py').write_text('')
+        (pkg_dir / '_private.py').write_text('')
+        (pkg_dir / 'top.py').write_text('')
+        (sub_dir / '__init__.py').write_text('')
+        (sub_dir / 'nested.py').write_text('')
+
+        importlib.import_module('test_mtime_nested_pkg')
+        mtimes = get_package_file_mtimes('test_mtime_nested_pkg')
+
+        assert set(mtimes) == {str(pkg_dir / 'top.py'), str(sub_dir / 'nested.py')}
 
     def test_get_mtimes_invalid_package(self):
         """Test getting mtimes for non-existent package."""
@@ -197,6 +243,100 @@ class TestRegistryCacheManager:
             loaded = manager.load_cache()
             assert loaded == items
 
+    def test_save_and_load_cache_stdlib_json(self, tmp_path):
+        """Test that the stdlib json fallback round-trips without orjson."""
+        from metaclass_registry import cache as cache_module
+
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path)}), \
+                patch.object(cache_module, 'orjson', None):
+            manager = RegistryCacheManager(
+                cache_name='test_stdlib_json',
+                version_getter=lambda: '1.0',
+                serializer=lambda x: {'value': x},
+                deserializer=lambda x: x['value'],
+            )
+
+            items = {'key1': 'value1', 'key2': 'value2'}
+            manager.save_cache(items)
+
+            assert manager.load_cache() == items
+
+    def test_enum_keys(self, tmp_path):
+        """Test that registries keyed by str-Enum members are saved."""
+        from enum import Enum
+
+        class Kind(str, Enum):
+            DISK = 'disk'
+            MEMORY = 'memory'
+
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path)}):
+            manager = RegistryCacheManager(
+                cache_name='test_enum_keys',
+                version_getter=lambda: '1.0',
+                serializer=lambda x: {'value': x},
+                deserializer=lambda x: x['value'],
+            )
+
+            manager.save_cache({Kind.DISK: 'value1', Kind.MEMORY: 'value2'})
+
+            assert manager.load_cache() == {'disk': 'value1', 'memory': 'value2'}
+
+    def test_msgpack_codec_roundtrip(self, tmp_path):
+        """Test saving and loading cache with the msgpack codec."""
+        pytest.importorskip('msgpack')
+
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path)}):
+            manager = RegistryCacheManager(
+                cache_name='test_codec',
+                version_getter=lambda: '1.0',
+                serializer=lambda x: {'value': x},
+                deserializer=lambda x: x['value'],
+                codec='msgpack',
+            )
+
+            items = {'key1': 'value1', 'key2': 'value2'}
+            manager.save_cache(items)
+
+            assert manager._cache_path.suffix != '.json'
+            assert manager.load_cache() == items
+
+    @pytest.mark.parametrize('compression,suffix', [('gzip', '.gz'), ('zstd', '.zst')])
+    def test_compressed_cache_roundtrip(self, tmp_path, compression, suffix):
+        """Test saving and loading a compressed cache."""
+        if compression == 'zstd':
+            pytest.importorskip('zstandard')
+
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path)}):
+            manager = RegistryCacheManager(
+                cache_name='test_compressed',
+                version_getter=lambda: '1.0',
+                serializer=lambda x: {'value': x},
+                deserializer=lambda x: x['value'],
+                config=CacheConfig(compression=compression),
+            )
+            items = {f'key{i}': 'openhcs.processing.backends.value' for i in range(50)}
+            manager.save_cache(items)
+
+            assert manager._cache_path.name == f'test_compressed.json{suffix}'
+            assert manager.load_cache() == items
+
+            # Corrupt compressed data is handled like any corrupt cache
+            manager._cache_path.write_bytes(b'not compressed')
+            assert manager.load_cache() is None
+
+    @pytest.mark.parametrize('codec', ['yaml', 'pickle'])
+    def test_unknown_codec(self, tmp_path, codec):
+        """Test that an unknown (or unsafe) codec name is rejected."""
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path)}):
+            with pytest.raises(ValueError):
+                RegistryCacheManager(
+                    cache_name='test_bad_codec',
+                    version_getter=lambda: '1.0',
+                    serializer=lambda x: x,
+                    deserializer=lambda x: x,
+                    codec=codec,
+                )
+
     def test_cache_version_mismatch(self, tmp_path):
         """Test that cache is invalidated on version change."""
         import os
@@ -215,13 +355,279 @@ class TestRegistryCacheManager:
             items = {'key': 'value'}
             manager.save_cache(items)
 
-            # Change version
+            # Change version (the manager memoizes it until told otherwise)
             version[0] = '2.0'
+            manager.clear_version_cache()
 
             # Try to load cache - should be None due to version mismatch
             loaded = manager.load_cache()
             assert loaded is None
 
+    def test_version_getter_called_once(self, tmp_path):
+        """Test that the version getter result is memoized per manager."""
+        version_getter = Mock(return_value='1.0')
+
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path)}):
+            manager = RegistryCacheManager(
+                cache_name='test_version_memo',
+                version_getter=version_getter,
+                serializer=lambda x: {'value': x},
+                deserializer=lambda x: x['value'],
+            )
+
+            manager.save_cache({'key': 'value'})
+            manager.load_cache()
+            manager.load_cache()
+            assert version_getter.call_count == 1
+
+            manager.clear_version_cache()
+            manager.load_cache()
+            assert version_getter.call_count == 2
+
+    def test_mark_dirty_batches_writes(self, tmp_path):
+        """Test that mark_dirty() updates are merged and written in one flush."""
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path)}):
+            manager = RegistryCacheManager(
+                cache_name='test_dirty',
+                version_getter=lambda: '1.0',
+                serializer=lambda x: {'value': x},
+                deserializer=lambda x: x['value'],
+                config=CacheConfig(flush_delay=60.0),
+            )
+            manager.save_cache({'key1': 'value1'})
+
+            manager.mark_dirty('key2', 'value2')
+            manager.mark_dirty('key3', 'value3')
+
+            # Nothing written until the flush
+            assert manager.load_cache() == {'key1': 'value1'}
+
+            manager._flush()
+            assert manager.load_cache() == {
+                'key1': 'value1',
+                'key2': 'value2',
+                'key3': 'value3',
+            }
+            assert manager._flush_timer is None
+
+    def test_exit_flush_does_not_pin_managers(self, tmp_path):
+        """Test that managers are only tracked for the exit flush while dirty."""
+        import gc
+        import weakref
+        from metaclass_registry import cache as cache_module
+
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path)}):
+            manager = RegistryCacheManager(
+                cache_name='test_exit_flush',
+                version_getter=lambda: '1.0',
+                serializer=lambda x: {'value': x},
+                deserializer=lambda x: x['value'],
+                config=CacheConfig(flush_delay=60.0),
+            )
+            manager.save_cache({'key1': 'value1'})
+            manager.mark_dirty('key2', 'value2')
+            assert manager in cache_module._managers_to_flush
+
+            # The exit hook writes what is still pending
+            cache_module._flush_all_at_exit()
+            assert manager not in cache_module._managers_to_flush
+            assert manager.load_cache() == {'key1': 'value1', 'key2': 'value2'}
+
+            ref = weakref.ref(manager)
+            del manager
+            gc.collect()
+            assert ref() is None
+
+    def test_append_item_and_compact(self, tmp_path):
+        """Test appending items to the log and folding them into the snapshot."""
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path)}):
+            manager = RegistryCacheManager(
+                cache_name='test_append',
+                version_getter=lambda: '1.0',
+                serializer=lambda x: {'value': x},
+                deserializer=lambda x: x['value'],
+                config=CacheConfig(compact_threshold=3),
+            )
+            manager.save_cache({'key1': 'value1'})
+            snapshot = manager._cache_path.read_bytes()
+
+            manager.append_item('key2', 'value2')
+            manager.append_item('key1', 'updated')
+
+            # Snapshot untouched, updates replayed from the log
+            assert manager._cache_path.read_bytes() == snapshot
+            assert manager._log_path.exists()
+            assert manager.load_cache() == {'key1': 'updated', 'key2': 'value2'}
+
+            # Third entry reaches the threshold and compacts
+            manager.append_item('key3', 'value3')
+            assert not manager._log_path.exists()
+            assert manager.load_cache() == {
+                'key1': 'updated',
+                'key2': 'value2',
+                'key3': 'value3',
+            }
+
+    def test_append_before_save_is_not_a_cache(self, tmp_path):
+        """Test that items appended without a snapshot are not loaded as a full cache."""
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path)}):
+            manager = RegistryCacheManager(
+                cache_name='test_append_first',
+                version_getter=lambda: '1.0',
+                serializer=lambda x: {'value': x},
+                deserializer=lambda x: x['value'],
+                config=CacheConfig(check_mtimes=True, flush_delay=60.0),
+            )
+            manager.clear_cache()
+            manager.append_item('only', 1)
+            manager.mark_dirty('dirty', 2)
+            manager._flush()
+
+            assert manager.load_cache() is None
+            assert not manager._cache_path.exists()
+
+            manager.save_cache({'full': 3})
+            assert manager.load_cache() == {'full': 3}
+
+    def test_compact_keeps_stale_cache_invalid(self, tmp_path):
+        """Test that compaction neither revives a stale cache nor refreshes its header."""
+        version = {'value': '1.0'}
+
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path)}):
+            manager = RegistryCacheManager(
+                cache_name='test_compact_stale',
+                version_getter=lambda: version['value'],
+                serializer=lambda x: {'value': x},
+                deserializer=lambda x: x['value'],
+            )
+            manager.save_cache({'old': 1})
+            timestamp = json.loads(manager._cache_path.read_bytes())['timestamp']
+
+            # A valid snapshot keeps its original timestamp
+            manager.append_item('new', 2)
+            manager.compact()
+            assert json.loads(manager._cache_path.read_bytes())['timestamp'] == timestamp
+            assert manager.load_cache() == {'old': 1, 'new': 2}
+
+            version['value'] = '2.0'
+            manager.clear_version_cache()
+            assert manager.load_cache() is None
+
+            manager.append_item('newer', 3)
+            manager.compact()
+            assert not manager._log_path.exists()
+            assert manager.load_cache() is None
+
+    def test_lazy_items(self, tmp_path):
+        """Test that lazy loading deserializes items only when accessed."""
+        deserializer = Mock(side_effect=lambda x: x['value'])
+
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path)}):
+            manager = RegistryCacheManager(
+                cache_name='test_lazy',
+                version_getter=lambda: '1.0',
+                serializer=lambda x: {'value': x},
+                deserializer=deserializer,
+                config=CacheConfig(lazy_items=True),
+            )
+            manager.save_cache({'key1': 'value1', 'key2': 'value2'})
+
+            loaded = manager.load_cache()
+            assert len(loaded) == 2
+            assert 'key1' in loaded
+            assert deserializer.call_count == 0
+
+            assert loaded['key1'] == 'value1'
+            assert loaded['key1'] == 'value1'
+            assert deserializer.call_count == 1
+
+            assert loaded.materialize_all() == {'key1': 'value1', 'key2': 'value2'}
+            assert deserializer.call_count == 2
+
+    def test_parallel_deserialization(self, tmp_path):
+        """Test thread-pool deserialization of a large cache."""
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path)}):
+            manager = RegistryCacheManager(
+                cache_name='test_parallel',
+                version_getter=lambda: '1.0',
+                serializer=lambda x: {'value': x},
+                deserializer=lambda x: x['value'],
+                config=CacheConfig(parallel=True),
+            )
+            items = {f'key{i}': f'value{i}' for i in range(100)}
+            manager.save_cache(items)
+
+            loaded = manager.load_cache()
+            assert loaded == items
+            assert list(loaded) == list(items)
+
+    def test_batch_deserializer(self, tmp_path):
+        """Test eager loads use the batch deserializer when given."""
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path)}):
+            deserializer = Mock()
+            manager = RegistryCacheManager(
+                cache_name='test_batch',
+                version_getter=lambda: '1.0',
+                serializer=serialize_plugin_class,
+                deserializer=deserializer,
+                batch_deserializer=deserialize_plugin_classes,
+            )
+            items = {'decoder': json.JSONDecoder, 'path': Path}
+            manager.save_cache(items)
+
+            assert manager.load_cache() == items
+            deserializer.assert_not_called()
+
+    def test_maybe_contains(self, tmp_path):
+        """Test negative key lookups through the header Bloom filter."""
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path)}):
+            manager = RegistryCacheManager(
+                cache_name='test_bloom',
+                version_getter=lambda: '1.0',
+                serializer=lambda x: {'value': x},
+                deserializer=lambda x: x['value'],
+            )
+            # No cache yet: cannot rule anything out
+            assert manager.maybe_contains('anything')
+
+            keys = [f'plugin_{i}' for i in range(50)]
+            manager.save_cache({key: key for key in keys})
+
+            # A fresh manager reads the filter from the header
+            reader = RegistryCacheManager(
+                cache_name='test_bloom',
+                version_getter=lambda: '1.0',
+                serializer=lambda x: {'value': x},
+                deserializer=lambda x: x['value'],
+            )
+            assert all(reader.maybe_contains(key) for key in keys)
+            absent = [f'missing_{i}' for i in range(200)]
+            assert sum(reader.maybe_contains(key) for key in absent) < 20
+
+            # Appended keys are never reported absent
+            reader.append_item('late_plugin', 'late')
+            assert reader.maybe_contains('late_plugin')
+
+    def test_non_str_keys(self, tmp_path):
+        """Test that int and str-Enum keys are saved and found by maybe_contains."""
+        from enum import Enum
+
+        class Kind(str, Enum):
+            DISK = 'disk'
+
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path)}):
+            manager = RegistryCacheManager(
+                cache_name='test_non_str_keys',
+                version_getter=lambda: '1.0',
+                serializer=lambda x: {'value': x},
+                deserializer=lambda x: x['value'],
+            )
+            manager.save_cache({1: 'one', Kind.DISK: 'disk'})
+
+            assert manager.load_cache() == {'1': 'one', 'disk': 'disk'}
+            for key in (1, '1', Kind.DISK, 'disk'):
+                assert manager.maybe_contains(key)
+
     def test_cache_age_invalidation(self, tmp_path):
         """Test that cache is invalidated when too old."""
         import os
@@ -289,6 +695,138 @@ class TestRegistryCacheManager:
             loaded = manager.load_cache()
             assert loaded is None
 
+    def test_cache_hash_validation(self, tmp_path):
+        """Test cache invalidation based on file content hashes."""
+        test_file = tmp_path / 'hashed.py'
+        test_file.write_text('# original')
+        mtime = test_file.stat().st_mtime
+
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path / 'cache')}):
+            manager = RegistryCacheManager(
+                cache_name='test_hash',
+                version_getter=lambda: '1.0',
+                serializer=lambda x: {'value': x},
+                deserializer=lambda x: x['value'],
+                config=CacheConfig(check_hashes=True),
+            )
+            manager.save_cache({'key': 'value'}, file_mtimes={str(test_file): mtime})
+            assert manager.load_cache() == {'key': 'value'}
+
+            # Same mtime, different content: only the hash notices
+            test_file.write_text('# modified')
+            os.utime(test_file, (mtime, mtime))
+            assert manager.load_cache() is None
+
+    def test_source_package_digest(self, tmp_path, isolated_sys_modules):
+        """Test invalidation through the single package mtime digest."""
+        import importlib
+
+        pkg_dir = tmp_path / 'test_digest_pkg'
+        pkg_dir.mkdir()
+        (pkg_dir / '__init__.py').write_text('')
+        (pkg_dir / 'plugin.py').write_text('# plugin')
+
+        importlib.import_module('test_digest_pkg')
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path / 'cache')}):
+            manager = RegistryCacheManager(
+                cache_name='test_digest',
+                version_getter=lambda: '1.0',
+                serializer=lambda x: {'value': x},
+                deserializer=lambda x: x['value'],
+                config=CacheConfig(check_mtimes=True, source_package='test_digest_pkg'),
+            )
+            manager.save_cache({'key': 'value'})
+
+            data = json.loads(manager._cache_path.read_bytes())
+            assert 'source_digest' in data
+            assert 'file_mtimes' not in data
+            assert manager.load_cache() == {'key': 'value'}
+
+            # A newly added module changes the digest
+            (pkg_dir / 'new_plugin.py').write_text('# new')
+            assert manager.load_cache() is None
+
+    def test_cache_mtime_validation_deleted_file(self, tmp_path):
+        """Test cache invalidation when a tracked file is deleted."""
+        test_file = tmp_path / 'deleted.py'
+        test_file.write_text('# original')
+
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path / 'cache')}):
+            manager = RegistryCacheManager(
+                cache_name='test_mtime_deleted',
+                version_getter=lambda: '1.0',
+                serializer=lambda x: {'value': x},
+                deserializer=lambda x: x['value'],
+                config=CacheConfig(check_mtimes=True),
+            )
+            manager.save_cache(
+                {'key': 'value'},
+                file_mtimes={str(test_file): test_file.stat().st_mtime},
+            )
+
+            test_file.unlink()
+            assert manager.load_cache() is None
+
+    def test_save_is_atomic(self, tmp_path):
+        """Test that saving replaces the cache file without leaving temp files."""
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path)}):
+            manager = RegistryCacheManager(
+                cache_name='test_atomic',
+                version_getter=lambda: '1.0',
+                serializer=lambda x: {'value': x},
+                deserializer=lambda x: x['value'],
+            )
+            manager.save_cache({'key': 'old'})
+
+            with patch('metaclass_registry.cache.os.replace', side_effect=OSError('boom')):
+                manager.save_cache({'key': 'new'})  # Should not raise
+
+            # Failed write leaves the previous cache intact and no temp file
+            assert manager.load_cache() == {'key': 'old'}
+            assert [p.name for p in manager._cache_path.parent.iterdir()] == [
+                manager._cache_path.name
+            ]
+
+    @pytest.mark.skipif(sys.platform == 'win32', reason="POSIX permission bits")
+    def test_save_follows_umask(self, tmp_path):
+        """Test that atomically written caches get the umask mode, not mkstemp's 0600."""
+        import os
+        import stat
+        from metaclass_registry import cache as cache_module
+
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path)}):
+            manager = RegistryCacheManager(
+                cache_name='test_mode',
+                version_getter=lambda: '1.0',
+                serializer=lambda x: {'value': x},
+                deserializer=lambda x: x['value'],
+            )
+            old_umask = os.umask(0o022)
+            cache_module._file_mode.cache_clear()
+            try:
+                manager.save_cache({'key': 'value'})
+            finally:
+                os.umask(old_umask)
+                cache_module._file_mode.cache_clear()
+
+            assert stat.S_IMODE(manager._cache_path.stat().st_mode) == 0o644
+
+    def test_save_recreates_removed_cache_dir(self, tmp_path):
+        """Test that saving recreates a cache directory removed after init."""
+        import shutil
+
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path)}):
+            manager = RegistryCacheManager(
+                cache_name='test_removed_dir',
+                version_getter=lambda: '1.0',
+                serializer=lambda x: {'value': x},
+                deserializer=lambda x: x['value'],
+            )
+            shutil.rmtree(manager._cache_path.parent)
+
+            manager.save_cache({'key': 'value'})
+            assert manager.load_cache() == {'key': 'value'}
+
     def test_clear_cache(self, tmp_path):
         """Test clearing the cache."""
         import os
@@ -331,6 +869,20 @@ class TestRegistryCacheManager:
             assert loaded is None
             assert not manager._cache_path.exists()
 
+    def test_empty_cache_file_handling(self, tmp_path):
+        """Test handling of an empty (truncated) cache file."""
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path)}):
+            manager = RegistryCacheManager(
+                cache_name='test_empty',
+                version_getter=lambda: '1.0',
+                serializer=lambda x: {'value': x},
+                deserializer=lambda x: x['value'],
+            )
+            manager._cache_path.write_bytes(b'')
+
+            assert manager.load_cache() is None
+            assert not manager._cache_path.exists()
+
     def test_serialization_error_handling(self, tmp_path):
         """Test handling of serialization errors."""
         import os
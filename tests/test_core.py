@@ -1,17 +1,21 @@
 """Tests for metaclass_registry.core module."""
 
+import sys
+import weakref
+from unittest.mock import patch
+
 import pytest
 from metaclass_registry import (
     AutoRegisterMeta,
     RegistryConfig,
     LazyDiscoveryDict,
     SecondaryRegistryDict,
-    SecondaryRegistry,
-    PRIMARY_KEY,
     extract_key_from_handler_suffix,
     extract_key_from_backend_suffix,
     make_suffix_extractor,
 )
+from metaclass_registry import core
+from metaclass_registry.core import _find_module_global, _get_discovery_function, _has_subpackages
 
 
 class TestLazyDiscoveryDict:
@@ -45,6 +49,158 @@ class TestLazyDiscoveryDict:
         result = registry.get('nonexistent', 'default')
         assert result == 'default'
 
+    def test_slots(self):
+        """Test that registries have no per-instance __dict__ but stay dicts."""
+        registry = LazyDiscoveryDict(enable_cache=False)
+        secondary = SecondaryRegistryDict(registry)
+        for instance in (registry, secondary):
+            assert isinstance(instance, dict)
+            assert not hasattr(instance, '__dict__')
+            weakref.ref(instance)
+
+
+    def test_discovery_runs_once_and_drops_guard(self):
+        """Test that discovery runs once and later lookups use plain dict access."""
+        registry = LazyDiscoveryDict(enable_cache=False)
+        calls = []
+
+        def discovery_function(path, prefix, base_class):
+            calls.append(prefix)
+            registry['found'] = base_class
+
+        registry._set_config(object, RegistryConfig(
+            registry_dict=registry,
+            key_attribute='name',
+            discovery_package='json',
+            discovery_function=discovery_function,
+        ))
+
+        assert registry['found'] is object
+        assert 'found' in registry
+        assert list(registry) == ['found']
+        assert calls == ['json.']
+        assert isinstance(registry, LazyDiscoveryDict)
+        assert type(registry).__getitem__ is dict.__getitem__
+
+
+    def test_subclass_keeps_its_class(self):
+        """Test that subclasses keep their class and overrides after discovery."""
+
+        class PlainRegistry(LazyDiscoveryDict):
+            pass
+
+        class SlottedRegistry(LazyDiscoveryDict):
+            __slots__ = ()
+
+            def get(self, key, default=None):
+                return ('overridden', super().get(key, default))
+
+        for cls in (PlainRegistry, SlottedRegistry):
+            registry = cls(enable_cache=False)
+            registry._set_config(object, RegistryConfig(
+                registry_dict=registry,
+                key_attribute='name',
+                discovery_package='json',
+                discovery_function=lambda path, prefix, base_class, r=registry: dict.__setitem__(r, 'found', 1),
+            ))
+            assert registry['found'] == 1
+            assert type(registry) is cls
+
+        assert registry.get('found') == ('overridden', 1)
+
+    def test_copy_discovers_itself(self):
+        """Test that a copied registry runs discovery on the copy, not the original."""
+        import copy
+
+        registry = LazyDiscoveryDict(enable_cache=False)
+        registry._set_config(object, RegistryConfig(
+            registry_dict=registry,
+            key_attribute='name',
+            discovery_package='json',
+            discovery_function=lambda path, prefix, base_class: None,
+        ))
+
+        registry._discovered = True  # Copying reads the items, which discovers
+        clone = copy.copy(registry)
+        clone._discovered = False
+        len(clone)
+        assert clone._discovered
+
+    def test_reentrant_access_during_discovery(self):
+        """Test that lookups made by discovered modules do not re-run discovery."""
+        registry = LazyDiscoveryDict(enable_cache=False)
+        calls = []
+
+        def discovery_function(path, prefix, base_class):
+            calls.append(prefix)
+            assert not registry._discovered
+            assert 'found' not in registry  # Re-entrant read sees the partial registry
+            registry['found'] = base_class
+
+        registry._set_config(object, RegistryConfig(
+            registry_dict=registry,
+            key_attribute='name',
+            discovery_package='json',
+            discovery_function=discovery_function,
+        ))
+
+        assert 'found' in registry
+        assert registry._discovered
+        assert calls == ['json.']
+
+    def test_registrations_during_discovery_logged_once(self, caplog):
+        """Test that classes registered by discovery are logged as one record."""
+
+        class Plugin(metaclass=AutoRegisterMeta):
+            __registry_key__ = 'name'
+            name = None
+
+        def discovery_function(path, prefix, base_class):
+            class PluginA(Plugin):
+                name = 'a'
+
+            class PluginB(Plugin):
+                name = 'b'
+
+        registry = Plugin.__registry__
+        registry._set_config(Plugin, RegistryConfig(
+            registry_dict=registry,
+            key_attribute='name',
+            discovery_package='json',
+            discovery_function=discovery_function,
+        ))
+        registry._cache_requested = False
+
+        with caplog.at_level('DEBUG', logger=core.__name__):
+            assert registry.keys() == {'a', 'b'}
+        messages = [r.getMessage() for r in caplog.records if 'Auto-registered' in r.getMessage()]
+        assert messages == ["Auto-registered 2 plugins: PluginA as 'a', PluginB as 'b'"]
+        assert registry._registration_log is None
+
+    def test_config_without_package_is_discovered(self):
+        """Test that a config with no discovery package never tries to discover."""
+        registry = LazyDiscoveryDict(enable_cache=False)
+        registry._set_config(object, RegistryConfig(registry_dict=registry, key_attribute='name'))
+        assert registry._discovered
+        assert len(registry) == 0
+
+
+    def test_cache_manager_created_on_first_access(self, tmp_path):
+        """Test that the cache manager is only built when discovery runs."""
+        registry = LazyDiscoveryDict()
+        registry._set_config(object, RegistryConfig(
+            registry_dict=registry,
+            key_attribute='name',
+            registry_name='lazy cache',
+            discovery_package='json',
+            discovery_function=lambda path, prefix, base_class: None,
+        ))
+        assert registry._cache_manager is None
+
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path)}):
+            len(registry)
+        assert registry._cache_manager is not None
+
 
 class TestSecondaryRegistryDict:
     """Test SecondaryRegistryDict functionality."""
@@ -55,24 +211,61 @@ class TestSecondaryRegistryDict:
         secondary = SecondaryRegistryDict(primary)
         assert secondary._primary_registry is primary
 
+    def test_pre_populated_entries_merged_on_access(self):
+        """Test entries of a replaced plain dict appear once the registry is read."""
+        secondary = SecondaryRegistryDict({})
+        secondary._pre_populated = {'legacy': 'old', 'shared': 'old'}
+        secondary['shared'] = 'new'  # Registered after wrapping
+
+        assert dict(secondary.items()) == {'legacy': 'old', 'shared': 'new'}
+        assert secondary._pre_populated is None
+
+    def test_plain_dict_primary(self):
+        """Test a secondary registry whose primary has no discovery."""
+        secondary = SecondaryRegistryDict({})
+        secondary['key'] = 'value'
+        assert secondary['key'] == 'value'
+        # Nothing to discover, so the guard is dropped on first access
+        assert type(secondary).__getitem__ is dict.__getitem__
+
+    def test_subclass_keeps_its_class(self):
+        """Test that subclasses are not swapped to the resolved class."""
+
+        class MySecondary(SecondaryRegistryDict):
+            def get(self, key, default=None):
+                return 'overridden'
+
+        secondary = MySecondary({})
+        secondary['key'] = 'value'
+        assert secondary['key'] == 'value'
+        assert type(secondary) is MySecondary
+        assert secondary.get('key') == 'overridden'
+
     def test_auto_discovery_trigger(self):
         """Test that accessing secondary registry triggers primary discovery."""
         primary = LazyDiscoveryDict(enable_cache=False)
-        primary._discovered = False
-        secondary = SecondaryRegistryDict(primary)
-
-        # Mock _discover method
         discover_called = []
 
-        def mock_discover():
-            discover_called.append(True)
-            primary._discovered = True
+        def discovery_function(path, prefix, base_class):
+            discover_called.append(prefix)
 
-        primary._discover = mock_discover
+        primary._set_config(object, RegistryConfig(
+            registry_dict=primary,
+            key_attribute='name',
+            discovery_package='json',
+            discovery_function=discovery_function,
+        ))
+        secondary = SecondaryRegistryDict(primary)
 
         # Access secondary registry - should trigger discovery
         _ = len(secondary)
-        assert len(discover_called) == 1
+        assert discover_called == ['json.']
+
+        # Once the primary is discovered, access no longer goes through the guard
+        _ = len(secondary)
+        assert discover_called == ['json.']
+        assert isinstance(secondary, SecondaryRegistryDict)
+        assert type(secondary).__len__ is dict.__len__
 
 
 class TestRegistryConfig:
@@ -91,14 +284,23 @@ class TestRegistryConfig:
         assert config.log_registration is True
         assert config.registry_name == "plugin"
 
-    def test_full_config(self):
+    def test_key_getter(self):
+        """Test that the key getter follows key_attribute through replace()."""
+        from dataclasses import replace
+
+        class Plugin:
+            _key = 'a'
+            _other = 'b'
+
+        config = RegistryConfig(registry_dict={}, key_attribute='_key')
+        assert config.key_getter(Plugin) == 'a'
+        assert replace(config, key_attribute='_other').key_getter(Plugin) == 'b'
+        assert config == RegistryConfig(registry_dict=config.registry_dict, key_attribute='_key')
+
+    def test_full_config(self, make_secondary):
         """Test RegistryConfig with all fields."""
         registry_dict = {}
-        secondary = SecondaryRegistry(
-            registry_dict={},
-            key_source=PRIMARY_KEY,
-            attr_name='_handler',
-        )
+        secondary = make_secondary({}, attr_name='_handler')
 
         def key_extractor(name, cls):
             return name.lower()
@@ -117,6 +319,7 @@ class TestRegistryConfig:
 
         assert config.skip_if_no_key is True
         assert config.log_registration is False
+        assert config.secondary_registries == (secondary,)
         assert config.registry_name == 'test plugin'
         assert config.discovery_package == 'test.package'
         assert config.discovery_recursive is True
@@ -185,18 +388,14 @@ class TestAutoRegisterMeta:
         # ChildPlugin should be able to access the registry through the parent
         assert BasePlugin.__registry__ is not None
 
-    def test_secondary_registry(self):
+    def test_secondary_registry(self, make_secondary):
         """Test secondary registry registration."""
         HANDLERS = {}
 
         class Plugin(metaclass=AutoRegisterMeta):
             __registry_key__ = 'name'
             __secondary_registries__ = [
-                SecondaryRegistry(
-                    registry_dict=HANDLERS,
-                    key_source=PRIMARY_KEY,
-                    attr_name='handler_class',
-                )
+                make_secondary(HANDLERS)
             ]
             name = None
             handler_class = None
@@ -215,6 +414,30 @@ class TestAutoRegisterMeta:
         assert 'my_plugin' in HANDLERS
         assert HANDLERS['my_plugin'] is DummyHandler
 
+    def test_wrapped_secondary_sees_later_subclasses(self, make_secondary, monkeypatch):
+        """Test subclasses defined after the wrapper's first access still land in it."""
+        import types
+
+        module = types.ModuleType('fake_secondary_module')
+        module.HANDLERS = original = {}
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+
+        Plugin = AutoRegisterMeta('Plugin', (), {
+            '__module__': module.__name__,
+            '__registry_key__': 'name',
+            '__secondary_registries__': [make_secondary(original)],
+            'name': None,
+            'handler_class': None,
+        })
+        handlers = module.HANDLERS
+        assert isinstance(handlers, SecondaryRegistryDict)
+
+        AutoRegisterMeta('Early', (Plugin,), {'name': 'early', 'handler_class': int})
+        assert handlers['early'] is int  # Merges the replaced dict, once
+
+        AutoRegisterMeta('Late', (Plugin,), {'name': 'late', 'handler_class': str})
+        assert handlers['late'] is str
+
     def test_key_extractor(self):
         """Test custom key extraction function."""
 
@@ -253,7 +476,7 @@ class TestAutoRegisterMeta:
     def test_require_key(self):
         """Test that missing key raises error when skip_if_no_key=False."""
 
-        with pytest.raises(ValueError, match="must have name attribute"):
+        with pytest.raises(ValueError) as exc_info:
 
             class Plugin(metaclass=AutoRegisterMeta):
                 __registry_key__ = 'name'
@@ -263,6 +486,45 @@ class TestAutoRegisterMeta:
             class PluginWithoutName(Plugin):
                 pass  # This should raise
 
+        assert "must have name attribute" in str(exc_info.value)
+
+    def test_compiled_register(self):
+        """Test the compiled register function and its generic fallback."""
+        registry = {}
+        config = RegistryConfig(registry_dict=registry, key_attribute='_key',
+                                key_extractor=lambda name, cls: name.lower())
+
+        class Plugin:
+            _key = None
+
+        assert config.register_fn(Plugin, 'Plugin') == 'plugin'
+        assert registry == {'plugin': Plugin}
+        assert Plugin._key == 'plugin'
+
+        # Names that cannot be inlined fall back to the generic path
+        assert RegistryConfig(registry_dict={}, key_attribute='meta.key').register_fn is None
+        assert RegistryConfig(registry_dict={}, key_attribute='class').register_fn is None
+
+    def test_overridden_hook_skips_compiled_path(self):
+        """Test that metaclasses overriding registration hooks still get them called."""
+        calls = []
+
+        class TracingMeta(AutoRegisterMeta):
+            @staticmethod
+            def _register_class(cls, key, config):
+                calls.append(key)
+                AutoRegisterMeta._register_class(cls, key, config)
+
+        class Plugin(metaclass=TracingMeta):
+            __registry_key__ = 'name'
+            name = None
+
+        class MyPlugin(Plugin):
+            name = 'mine'
+
+        assert calls == ['mine']
+        assert Plugin.__registry__['mine'] is MyPlugin
+
 
 class TestSuffixExtractors:
     """Test suffix extraction helper functions."""
@@ -310,10 +572,45 @@ class TestSuffixExtractors:
         result = extractor('NoSuffix', DummyClass)
         assert result == 'nosuffix'
 
+        # An empty suffix leaves the name intact
+        assert make_suffix_extractor('')('FileManager', DummyClass) == 'filemanager'
+
+    def test_extractors_share_name_cache(self):
+        """Test that extracted keys are cached by (name, suffix), ignoring cls."""
+
+        class DummyClass:
+            pass
+
+        core._extract_cached.cache_clear()
+        make_suffix_extractor('Backend')('DiskBackend', DummyClass)
+        assert extract_key_from_backend_suffix('DiskBackend', object) == 'disk'
+        assert core._extract_cached.cache_info().hits == 1
+
 
 class TestAutoConfiguration:
     """Test automatic registry configuration."""
 
+    def test_inherited_config_resolved_once_per_base(self):
+        """Test sibling subclasses reuse the base's resolved registry config."""
+
+        class Plugin(metaclass=AutoRegisterMeta):
+            __registry_key__ = 'name'
+            name = None
+
+        class PluginA(Plugin):
+            name = 'a'
+
+        assert Plugin in core._inherited_registry_cache
+        cached = core._inherited_registry_cache[Plugin]
+
+        class PluginB(Plugin):
+            name = 'b'
+
+        assert core._inherited_registry_cache[Plugin] is cached
+        assert cached.registry_dict is Plugin.__registry__
+        assert cached.registry_name == 'plugin'
+        assert Plugin.__registry__.keys() == {'a', 'b'}
+
     def test_auto_registry_name_derivation(self):
         """Test automatic derivation of registry name from class name."""
 
@@ -326,7 +623,11 @@ class TestAutoConfiguration:
 
         # Registry name should be auto-derived from class name
         # "StorageBackend" -> "storage backend"
-        # This is tested indirectly through the logging/config system
+        assert StorageBackend.__registry__._config.registry_name == 'storage backend'
+        # The derived name is not set on the class, so subclasses keep deriving
+        # theirs from their own base
+        assert not hasattr(StorageBackend, '__registry_name__')
+        assert core._inherited_registry_config(DiskStorage).registry_name == 'disk storage'
 
     def test_auto_registry_creation(self):
         """Test that __registry__ is automatically created."""
@@ -340,6 +641,138 @@ class TestAutoConfiguration:
         assert isinstance(MyPlugin.__registry__, LazyDiscoveryDict)
 
 
+class TestSubpackageDetection:
+    """Test subpackage detection used to infer discovery_recursive."""
+
+    def test_flat_package(self, temp_package):
+        """Test a package with only modules and plain directories."""
+        (temp_package / "module.py").write_text("")
+        (temp_package / "data").mkdir()
+        assert _has_subpackages([str(temp_package)]) is False
+
+    def test_nested_package(self, temp_package):
+        """Test a package containing a subpackage."""
+        (temp_package / "sub").mkdir()
+        (temp_package / "sub" / "__init__.py").write_text("")
+        assert _has_subpackages([str(temp_package)]) is True
+
+    def test_result_is_memoized(self, temp_package):
+        """Test that each package directory is walked only once."""
+        assert _has_subpackages([str(temp_package)]) is False
+        (temp_package / "sub").mkdir()
+        (temp_package / "sub" / "__init__.py").write_text("")
+        assert _has_subpackages([str(temp_package)]) is False
+
+    def test_missing_path(self, tmp_path):
+        """Test that non-directory paths are skipped."""
+        assert _has_subpackages([str(tmp_path / "missing")]) is False
+
+    def test_explicit_recursive_skips_scan(self):
+        """Test that an explicit discovery_recursive is kept and no scan runs."""
+        registry = LazyDiscoveryDict(enable_cache=False)
+        config = RegistryConfig(
+            registry_dict=registry,
+            key_attribute='name',
+            discovery_package='json',
+            discovery_recursive=False,
+        )
+
+        with patch.object(core, '_has_subpackages') as has_subpackages:
+            AutoRegisterMeta('Plugin', (), {'name': None}, registry_config=config)
+        has_subpackages.assert_not_called()
+        assert registry._config.discovery_recursive is False
+
+    def test_recursive_inferred_when_unset(self):
+        """Test that discovery_recursive is inferred when left as None."""
+        registry = LazyDiscoveryDict(enable_cache=False)
+        config = RegistryConfig(registry_dict=registry, key_attribute='name', discovery_package='json')
+
+        AutoRegisterMeta('Plugin', (), {'name': None}, registry_config=config)
+        assert registry._config.discovery_recursive is False
+
+
+class TestFindModuleGlobal:
+    """Test the module-global reverse lookup used when wrapping secondary registries."""
+
+    def test_finds_and_refreshes(self):
+        """Test lookups stay correct after the module's globals change."""
+        import types
+
+        module = types.ModuleType('fake_registry_module')
+        first, second = {}, {}
+        module.FIRST = first
+        assert _find_module_global(module, first) == 'FIRST'
+
+        # Added after the index was built
+        module.SECOND = second
+        assert _find_module_global(module, second) == 'SECOND'
+
+        # Rebinding a name must not return the stale entry
+        module.FIRST = {}
+        assert _find_module_global(module, first) is None
+
+
+class TestDiscoveryFunctionLookup:
+    """Test resolution of the default <root>.core.registry_discovery functions."""
+
+    def test_lookup_is_cached(self, monkeypatch):
+        """Test the discovery module is only imported once per root."""
+        import types
+
+        mod = types.ModuleType('fakeroot.core.registry_discovery')
+        mod.discover_registry_classes = lambda *args: None
+        mod.discover_registry_classes_recursive = lambda *args: None
+        monkeypatch.setattr(core, '_discovery_funcs_cache', {})
+        monkeypatch.setitem(sys.modules, 'fakeroot.core.registry_discovery', mod)
+
+        assert _get_discovery_function('fakeroot', False) is mod.discover_registry_classes
+        assert _get_discovery_function('fakeroot', True) is mod.discover_registry_classes_recursive
+
+        monkeypatch.delitem(sys.modules, 'fakeroot.core.registry_discovery')
+        assert _get_discovery_function('fakeroot', False) is mod.discover_registry_classes
+
+    def test_missing_module_not_cached(self, monkeypatch):
+        """Test that a failed lookup raises and is retried next time."""
+        monkeypatch.setattr(core, '_discovery_funcs_cache', {})
+        with pytest.raises(ImportError):
+            _get_discovery_function('no_such_root_pkg', False)
+        assert core._discovery_funcs_cache == {}
+
+
+class TestRootPackageVersion:
+    """Test the shared root-package version lookup used by registry caches."""
+
+    def test_clear_version_cache_sees_new_version(self, monkeypatch):
+        """Test that clearing a registry cache's version picks up an upgraded package."""
+        import types
+
+        mod = types.ModuleType('fake_versioned_root')
+        mod.__version__ = '1.2.3'
+        monkeypatch.setitem(sys.modules, 'fake_versioned_root', mod)
+
+        registry = LazyDiscoveryDict()
+        registry._set_config(object, RegistryConfig(
+            registry_dict=registry,
+            key_attribute='name',
+            registry_name='versioned',
+            discovery_package='fake_versioned_root',
+            discovery_function=lambda path, prefix, base_class: None,
+        ))
+        registry._init_cache_manager()
+        manager = registry._cache_manager
+        manager.save_cache({'key': object})
+        assert manager.load_cache() == {'key': object}
+
+        mod.__version__ = '9.9.9'
+        assert manager.load_cache() == {'key': object}  # Version memoized per manager
+        manager.clear_version_cache()
+        assert manager.load_cache() is None
+
+    def test_missing_package(self):
+        """Test that an unimportable root package reports 'unknown'."""
+        assert core._root_package_version('no_such_root_pkg') == 'unknown'
+
+
 class TestComplexScenarios:
     """Test complex real-world scenarios."""
 
@@ -378,7 +811,7 @@ class TestComplexScenarios:
 
         # All should be registered
         assert len(Plugin.__registry__) == 3
-        assert set(Plugin.__registry__.keys()) == {'a', 'b', 'c'}
+        assert Plugin.__registry__.keys() == {'a', 'b', 'c'}
 
     def test_duplicate_key_overwrite(self):
         """Test that duplicate keys overwrite previous registration."""
@@ -396,18 +829,14 @@ class TestComplexScenarios:
         # Last one should win
         assert Plugin.__registry__['same'] is PluginB
 
-    def test_secondary_registry_without_attr(self):
+    def test_secondary_registry_without_attr(self, make_secondary):
         """Test secondary registry when class doesn't have the attribute."""
         HANDLERS = {}
 
         class Plugin(metaclass=AutoRegisterMeta):
             __registry_key__ = 'name'
             __secondary_registries__ = [
-                SecondaryRegistry(
-                    registry_dict=HANDLERS,
-                    key_source=PRIMARY_KEY,
-                    attr_name='handler_class',
-                )
+                make_secondary(HANDLERS)
             ]
             name = None
             handler_class = None
@@ -1,253 +1,349 @@
 """Tests for metaclass_registry.discovery module."""
 
 import importlib
+import os
 import sys
 import tempfile
 from pathlib import Path
 from typing import Type
+from unittest.mock import patch
 
 import pytest
 
 from metaclass_registry.discovery import (
+    LazyClassRef,
+    _exclusion_filter,
+    _memoized_validator,
+    _walk_modules,
+    discover_from_entry_points,
     discover_registry_classes,
+    discover_registry_classes_lazy,
     discover_registry_classes_recursive,
+    iter_discover_registry_classes,
 )
 
 
-class TestDiscoverRegistryClasses:
-    """Test discover_registry_classes function."""
+BASE_SOURCE = "class BasePlugin:\n    pass\n"
 
-    def test_discover_simple_classes(self, tmp_path):
-        """Test discovering classes from a simple package."""
-        # Create a temporary package structure
-        pkg_dir = tmp_path / "test_pkg"
-        pkg_dir.mkdir()
-        (pkg_dir / "__init__.py").write_text("")
 
-        # Create a base class module
-        (pkg_dir / "base.py").write_text(
-            """
-class BasePlugin:
-    pass
-"""
-        )
+def plugin_source(class_name, body="pass"):
+    """Source of a module defining one BasePlugin subclass."""
+    return f"from .base import BasePlugin\n\nclass {class_name}(BasePlugin):\n    {body}\n"
 
-        # Create plugin modules
-        (pkg_dir / "plugin_a.py").write_text(
-            """
-from .base import BasePlugin
 
-class PluginA(BasePlugin):
-    pass
-"""
-        )
+SIMPLE_PACKAGE = {
+    "base.py": BASE_SOURCE,
+    "plugin_a.py": plugin_source("PluginA"),
+    "plugin_b.py": plugin_source("PluginB"),
+}
 
-        (pkg_dir / "plugin_b.py").write_text(
-            """
-from .base import BasePlugin
 
-class PluginB(BasePlugin):
-    pass
-"""
-        )
+class TestDiscoverRegistryClasses:
+    """Test discover_registry_classes function."""
 
-        # Add to sys.path
-        sys.path.insert(0, str(tmp_path))
-        try:
-            # Import the base module
-            base_module = importlib.import_module("test_pkg.base")
-            BasePlugin = base_module.BasePlugin
+    def test_discover_simple_classes(self, plugin_package_factory, isolated_sys_modules):
+        """Test discovering classes from a simple package."""
+        plugin_package_factory("test_pkg", SIMPLE_PACKAGE)
 
-            # Import package
-            pkg = importlib.import_module("test_pkg")
+        # Import the base module
+        base_module = importlib.import_module("test_pkg.base")
+        BasePlugin = base_module.BasePlugin
 
-            # Discover classes
-            discovered = discover_registry_classes(
-                package_path=pkg.__path__,
-                package_prefix="test_pkg.",
-                base_class=BasePlugin,
-                exclude_modules={'base'},
-            )
+        # Import package
+        pkg = importlib.import_module("test_pkg")
 
-            # Should find PluginA and PluginB
-            assert len(discovered) == 2
-            names = {cls.__name__ for cls in discovered}
-            assert names == {'PluginA', 'PluginB'}
+        # Discover classes
+        discovered = discover_registry_classes(
+            package_path=pkg.__path__,
+            package_prefix="test_pkg.",
+            base_class=BasePlugin,
+            exclude_modules={'base'},
+        )
 
-        finally:
-            # Clean up sys.path
-            sys.path.remove(str(tmp_path))
-            # Remove from sys.modules
-            for key in list(sys.modules.keys()):
-                if key.startswith('test_pkg'):
-                    del sys.modules[key]
-
-    def test_exclude_modules(self, tmp_path):
+        # Should find PluginA and PluginB
+        assert len(discovered) == 2
+        names = {cls.__name__ for cls in discovered}
+        assert names == {'PluginA', 'PluginB'}
+
+    def test_exclude_modules(self, plugin_package_factory, isolated_sys_modules):
         """Test excluding specific modules from discovery."""
-        # Create a temporary package structure
-        pkg_dir = tmp_path / "test_pkg2"
-        pkg_dir.mkdir()
-        (pkg_dir / "__init__.py").write_text("")
+        plugin_package_factory("test_pkg2", {
+            "base.py": BASE_SOURCE,
+            "plugin.py": plugin_source("Plugin"),
+            "test_plugin.py": plugin_source("TestPlugin"),
+        })
+
+        base_module = importlib.import_module("test_pkg2.base")
+        BasePlugin = base_module.BasePlugin
+        pkg = importlib.import_module("test_pkg2")
+
+        # Discover classes, excluding test modules
+        discovered = discover_registry_classes(
+            package_path=pkg.__path__,
+            package_prefix="test_pkg2.",
+            base_class=BasePlugin,
+            exclude_modules={'base', 'test_plugin'},
+        )
 
-        # Create base class
-        (pkg_dir / "base.py").write_text(
-            """
-class BasePlugin:
-    pass
-"""
+        # Should only find Plugin, not TestPlugin
+        # Note: exclude_modules checks if substring is in module name
+        # 'test_plugin' will match 'test_pkg2.test_plugin'
+        assert len(discovered) == 1
+        assert discovered[0].__name__ == 'Plugin'
+
+    def test_validation_func(self, plugin_package_factory, isolated_sys_modules):
+        """Test using a validation function to filter classes."""
+        plugin_package_factory("test_pkg3", {
+            "base.py": "class BasePlugin:\n    enabled = True\n",
+            "plugin_a.py": plugin_source("PluginA", body="enabled = True"),
+            "plugin_b.py": plugin_source("PluginB", body="enabled = False"),
+        })
+
+        base_module = importlib.import_module("test_pkg3.base")
+        BasePlugin = base_module.BasePlugin
+        pkg = importlib.import_module("test_pkg3")
+
+        # Only accept enabled plugins
+        def validate(cls):
+            return getattr(cls, 'enabled', False) is True
+
+        discovered = discover_registry_classes(
+            package_path=pkg.__path__,
+            package_prefix="test_pkg3.",
+            base_class=BasePlugin,
+            exclude_modules={'base'},
+            validation_func=validate,
         )
 
-        # Create plugin modules
-        (pkg_dir / "plugin.py").write_text(
-            """
-from .base import BasePlugin
+        # Should only find PluginA
+        assert len(discovered) == 1
+        assert discovered[0].__name__ == 'PluginA'
 
-class Plugin(BasePlugin):
-    pass
-"""
+    def test_no_classes_found(self, plugin_package_factory, isolated_sys_modules):
+        """Test when no matching classes are found."""
+        plugin_package_factory("test_pkg4", {
+            "base.py": BASE_SOURCE,
+            # Module with no plugin classes
+            "utils.py": "def helper():\n    pass\n",
+        })
+
+        base_module = importlib.import_module("test_pkg4.base")
+        BasePlugin = base_module.BasePlugin
+        pkg = importlib.import_module("test_pkg4")
+
+        discovered = discover_registry_classes(
+            package_path=pkg.__path__,
+            package_prefix="test_pkg4.",
+            base_class=BasePlugin,
+            exclude_modules={'base'},
         )
 
-        (pkg_dir / "test_plugin.py").write_text(
-            """
-from .base import BasePlugin
+        assert len(discovered) == 0
 
-class TestPlugin(BasePlugin):
-    pass
-"""
+    def test_package_listing_cached(self, tmp_path, isolated_sys_modules):
+        """Test that package listings are reused until the directory changes."""
+        pkg_dir = tmp_path / "test_pkg9"
+        pkg_dir.mkdir()
+        (pkg_dir / "__init__.py").write_text("")
+        (pkg_dir / "base.py").write_text("class BasePlugin:\n    pass\n")
+        (pkg_dir / "plugin_a.py").write_text(
+            "from .base import BasePlugin\n\nclass PluginA(BasePlugin):\n    pass\n"
         )
 
-        sys.path.insert(0, str(tmp_path))
-        try:
-            base_module = importlib.import_module("test_pkg2.base")
-            BasePlugin = base_module.BasePlugin
-            pkg = importlib.import_module("test_pkg2")
+        BasePlugin = importlib.import_module("test_pkg9.base").BasePlugin
+        pkg = importlib.import_module("test_pkg9")
 
-            # Discover classes, excluding test modules
-            discovered = discover_registry_classes(
+        def discover():
+            return discover_registry_classes(
                 package_path=pkg.__path__,
-                package_prefix="test_pkg2.",
+                package_prefix="test_pkg9.",
                 base_class=BasePlugin,
-                exclude_modules={'base', 'test_plugin'},
+                exclude_modules={'base'},
             )
 
-            # Should only find Plugin, not TestPlugin
-            # Note: exclude_modules checks if substring is in module name
-            # 'test_plugin' will match 'test_pkg2.test_plugin'
-            assert len(discovered) == 1
-            assert discovered[0].__name__ == 'Plugin'
+        assert [cls.__name__ for cls in discover()] == ['PluginA']
+        with patch('pkgutil.iter_modules') as iter_modules:
+            assert [cls.__name__ for cls in discover()] == ['PluginA']
+        iter_modules.assert_not_called()
 
-        finally:
-            sys.path.remove(str(tmp_path))
-            for key in list(sys.modules.keys()):
-                if key.startswith('test_pkg2'):
-                    del sys.modules[key]
+        # A new module changes the directory mtime and invalidates the listing
+        (pkg_dir / "plugin_b.py").write_text(
+            "from .base import BasePlugin\n\nclass PluginB(BasePlugin):\n    pass\n"
+        )
+        stat = os.stat(pkg_dir)
+        os.utime(pkg_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert [cls.__name__ for cls in discover()] == ['PluginA', 'PluginB']
+
+    def test_discovery_with_cache(self, tmp_path, plugin_package_factory, isolated_sys_modules):
+        """Test that a saved discovery result is returned without rescanning."""
+        from metaclass_registry.cache import (
+            CacheConfig,
+            RegistryCacheManager,
+            deserialize_plugin_class,
+            serialize_plugin_class,
+        )
 
-    def test_validation_func(self, tmp_path):
-        """Test using a validation function to filter classes."""
-        pkg_dir = tmp_path / "test_pkg3"
-        pkg_dir.mkdir()
-        (pkg_dir / "__init__.py").write_text("")
+        plugin_package_factory("test_pkg", SIMPLE_PACKAGE)
 
-        (pkg_dir / "base.py").write_text(
-            """
-class BasePlugin:
-    enabled = True
-"""
-        )
+        BasePlugin = importlib.import_module("test_pkg.base").BasePlugin
+        pkg = importlib.import_module("test_pkg")
 
-        (pkg_dir / "plugin_a.py").write_text(
-            """
-from .base import BasePlugin
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': str(tmp_path / "cache")}):
+            cache = RegistryCacheManager(
+                cache_name="test_pkg.base.BasePlugin",
+                version_getter=lambda: "1.0",
+                serializer=serialize_plugin_class,
+                deserializer=deserialize_plugin_class,
+                config=CacheConfig(check_mtimes=True),
+            )
 
-class PluginA(BasePlugin):
-    enabled = True
-"""
+            def discover():
+                return discover_registry_classes(
+                    package_path=pkg.__path__,
+                    package_prefix="test_pkg.",
+                    base_class=BasePlugin,
+                    exclude_modules={'base'},
+                    cache=cache,
+                )
+
+            first = discover()
+            assert [cls.__name__ for cls in first] == ['PluginA', 'PluginB']
+
+            with patch('metaclass_registry.discovery._iter_modules_cached') as scan:
+                assert discover() == first
+            scan.assert_not_called()
+
+    def test_virtual_subclasses_not_discovered(self, plugin_package_factory, isolated_sys_modules):
+        """Test that only classes actually inheriting from the base are found."""
+        plugin_package_factory("test_pkg11", {
+            "base.py": "from abc import ABC\n\nclass BasePlugin(ABC):\n    pass\n",
+            "plugins.py": (
+                "from .base import BasePlugin\n\n"
+                "class RealPlugin(BasePlugin):\n    pass\n\n"
+                "class VirtualPlugin:\n    pass\n\n"
+                "BasePlugin.register(VirtualPlugin)\n"
+            ),
+        })
+
+        BasePlugin = importlib.import_module("test_pkg11.base").BasePlugin
+        pkg = importlib.import_module("test_pkg11")
+
+        discovered = discover_registry_classes(
+            package_path=pkg.__path__,
+            package_prefix="test_pkg11.",
+            base_class=BasePlugin,
+            exclude_modules={'base'},
         )
 
-        (pkg_dir / "plugin_b.py").write_text(
-            """
-from .base import BasePlugin
-
-class PluginB(BasePlugin):
-    enabled = False
-"""
+        assert [cls.__name__ for cls in discovered] == ['RealPlugin']
+
+    def test_parallel_imports(self, plugin_package_factory, isolated_sys_modules):
+        """Test that thread-pool imports give the same ordered result."""
+        plugin_package_factory("test_pkg13", {
+            "base.py": BASE_SOURCE,
+            "broken.py": "import nonexistent_module_xyz\n",
+            **{f"plugin_{letter}.py": plugin_source(f"Plugin{letter.upper()}") for letter in "abcdef"},
+        })
+
+        BasePlugin = importlib.import_module("test_pkg13.base").BasePlugin
+        pkg = importlib.import_module("test_pkg13")
+
+        discovered = discover_registry_classes(
+            package_path=pkg.__path__,
+            package_prefix="test_pkg13.",
+            base_class=BasePlugin,
+            exclude_modules={'base'},
+            parallel=True,
         )
 
-        sys.path.insert(0, str(tmp_path))
-        try:
-            base_module = importlib.import_module("test_pkg3.base")
-            BasePlugin = base_module.BasePlugin
-            pkg = importlib.import_module("test_pkg3")
+        assert [cls.__name__ for cls in discovered] == [
+            'PluginA', 'PluginB', 'PluginC', 'PluginD', 'PluginE', 'PluginF'
+        ]
 
-            # Only accept enabled plugins
-            def validate(cls):
-                return getattr(cls, 'enabled', False) is True
+    def test_iter_stops_importing_early(self, plugin_package_factory, isolated_sys_modules):
+        """Test that the generator variant only imports what is consumed."""
+        plugin_package_factory("test_pkg", SIMPLE_PACKAGE)
 
-            discovered = discover_registry_classes(
-                package_path=pkg.__path__,
-                package_prefix="test_pkg3.",
-                base_class=BasePlugin,
-                exclude_modules={'base'},
-                validation_func=validate,
-            )
+        BasePlugin = importlib.import_module("test_pkg.base").BasePlugin
+        pkg = importlib.import_module("test_pkg")
 
-            # Should only find PluginA
-            assert len(discovered) == 1
-            assert discovered[0].__name__ == 'PluginA'
+        classes = iter_discover_registry_classes(
+            package_path=pkg.__path__,
+            package_prefix="test_pkg.",
+            base_class=BasePlugin,
+            exclude_modules={'base'},
+        )
 
-        finally:
-            sys.path.remove(str(tmp_path))
-            for key in list(sys.modules.keys()):
-                if key.startswith('test_pkg3'):
-                    del sys.modules[key]
+        assert next(classes).__name__ == 'PluginA'
+        assert 'test_pkg.plugin_a' in sys.modules
+        assert 'test_pkg.plugin_b' not in sys.modules
+        assert [cls.__name__ for cls in classes] == ['PluginB']
 
-    def test_no_classes_found(self, tmp_path):
-        """Test when no matching classes are found."""
-        pkg_dir = tmp_path / "test_pkg4"
-        pkg_dir.mkdir()
-        (pkg_dir / "__init__.py").write_text("")
+    def test_private_classes_skipped(self, plugin_package_factory, isolated_sys_modules):
+        """Test that underscore-prefixed classes are not discovered."""
+        plugin_package_factory("test_pkg15", {
+            "base.py": BASE_SOURCE,
+            "plugins.py": """
+from .base import BasePlugin
 
-        (pkg_dir / "base.py").write_text(
-            """
-class BasePlugin:
+class _PrivateBase(BasePlugin):
     pass
-"""
-        )
 
-        # Module with no plugin classes
-        (pkg_dir / "utils.py").write_text(
-            """
-def helper():
+class PublicPlugin(_PrivateBase):
     pass
-"""
+""",
+        })
+
+        BasePlugin = importlib.import_module("test_pkg15.base").BasePlugin
+        pkg = importlib.import_module("test_pkg15")
+        kwargs = dict(
+            package_path=pkg.__path__,
+            package_prefix="test_pkg15.",
+            base_class=BasePlugin,
+            exclude_modules={'base'},
         )
 
-        sys.path.insert(0, str(tmp_path))
-        try:
-            base_module = importlib.import_module("test_pkg4.base")
-            BasePlugin = base_module.BasePlugin
-            pkg = importlib.import_module("test_pkg4")
+        eager = discover_registry_classes(**kwargs)
+        lazy = discover_registry_classes_lazy(**kwargs)
 
-            discovered = discover_registry_classes(
-                package_path=pkg.__path__,
-                package_prefix="test_pkg4.",
-                base_class=BasePlugin,
-                exclude_modules={'base'},
-            )
+        assert [cls.__name__ for cls in eager] == ['PublicPlugin']
+        assert [ref.class_name for ref in lazy] == ['PublicPlugin']
 
-            assert len(discovered) == 0
+    def test_module_getattr_hooks_not_triggered(self, plugin_package_factory, isolated_sys_modules):
+        """Test that PEP 562 lazy module attributes are not fetched."""
+        plugin_package_factory("test_pkg17", {
+            "base.py": BASE_SOURCE,
+            "plugins.py": """
+from .base import BasePlugin
 
-        finally:
-            sys.path.remove(str(tmp_path))
-            for key in list(sys.modules.keys()):
-                if key.startswith('test_pkg4'):
-                    del sys.modules[key]
+class EagerPlugin(BasePlugin):
+    pass
+
+def __getattr__(name):
+    raise RuntimeError(f"lazy attribute {name} was loaded")
+
+def __dir__():
+    return ['EagerPlugin', 'LazyPlugin']
+""",
+        })
+
+        BasePlugin = importlib.import_module("test_pkg17.base").BasePlugin
+        pkg = importlib.import_module("test_pkg17")
+
+        discovered = discover_registry_classes(
+            package_path=pkg.__path__,
+            package_prefix="test_pkg17.",
+            base_class=BasePlugin,
+            exclude_modules={'base'},
+        )
+
+        assert [cls.__name__ for cls in discovered] == ['EagerPlugin']
 
 
 class TestDiscoverRegistryClassesRecursive:
     """Test discover_registry_classes_recursive function."""
 
-    def test_recursive_discovery(self, tmp_path):
+    def test_recursive_discovery(self, tmp_path, isolated_sys_modules):
         """Test recursive discovery through nested packages."""
         # Create nested package structure
         pkg_dir = tmp_path / "test_pkg5"
@@ -286,33 +382,135 @@ class PluginSub(BasePlugin):
 """
         )
 
-        sys.path.insert(0, str(tmp_path))
+        base_module = importlib.import_module("test_pkg5.base")
+        BasePlugin = base_module.BasePlugin
+        pkg = importlib.import_module("test_pkg5")
+
+        # Discover recursively
+        discovered = discover_registry_classes_recursive(
+            package_path=pkg.__path__,
+            package_prefix="test_pkg5.",
+            base_class=BasePlugin,
+            exclude_modules={'base'},
+        )
+
+        # Should find both top-level and nested plugins
+        assert len(discovered) >= 2
+        names = {cls.__name__ for cls in discovered}
+        assert 'PluginTop' in names
+        assert 'PluginSub' in names
+
+    def test_directory_becoming_package(self, tmp_path, isolated_sys_modules):
+        """Test that a subdirectory gaining __init__.py invalidates cached listings."""
+        from metaclass_registry.discovery import _iter_modules_cached
+
+        pkg_dir = tmp_path / "test_pkg19"
+        sub_dir = pkg_dir / "sub"
+        sub_dir.mkdir(parents=True)
+        (pkg_dir / "__init__.py").write_text("")
+        (pkg_dir / "base.py").write_text(BASE_SOURCE)
+        (pkg_dir / "plugin_a.py").write_text(plugin_source("PluginA"))
+        (sub_dir / "plugin_sub.py").write_text(
+            "from ..base import BasePlugin\n\nclass PluginSub(BasePlugin):\n    pass\n"
+        )
+
+        BasePlugin = importlib.import_module("test_pkg19.base").BasePlugin
+        pkg = importlib.import_module("test_pkg19")
+
+        def discover():
+            return {cls.__name__ for cls in discover_registry_classes_recursive(
+                package_path=pkg.__path__,
+                package_prefix="test_pkg19.",
+                base_class=BasePlugin,
+                exclude_modules={'base'},
+            )}
+
+        assert discover() == {'PluginA'}
+        assert ('test_pkg19.sub', True) not in _iter_modules_cached(pkg.__path__, "test_pkg19.")
+
+        # Only the subdirectory's mtime changes
+        (sub_dir / "__init__.py").write_text("")
+        stat = os.stat(sub_dir)
+        os.utime(sub_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        importlib.invalidate_caches()
+
+        assert discover() == {'PluginA', 'PluginSub'}
+        assert ('test_pkg19.sub', True) in _iter_modules_cached(pkg.__path__, "test_pkg19.")
+
+    def test_namespace_portions_walked_once(self, tmp_path):
+        """Test that names present in several portions are yielded once, as pkgutil does."""
+        portions = [tmp_path / "first" / "nspkg", tmp_path / "second" / "nspkg"]
+        for portion in portions:
+            (portion / "sub").mkdir(parents=True)
+            (portion / "shared.py").write_text("")
+            (portion / "sub" / "__init__.py").write_text("")
+        (portions[1] / "only_second.py").write_text("")
+        (portions[1] / "sub" / "extra.py").write_text("")
+
+        names = [name for name, _ in _walk_modules([str(p) for p in portions], "nspkg.")]
+        # The first portion's sub shadows the second's, so its contents are never walked
+        assert names == ['nspkg.shared', 'nspkg.sub', 'nspkg.only_second']
+
+    def test_module_free_packages_not_imported(self, tmp_path, isolated_sys_modules):
+        """Test that walking the tree does not import packages on its own."""
+        pkg_dir = tmp_path / "test_pkg12"
+        pkg_dir.mkdir()
+        (pkg_dir / "__init__.py").write_text("")
+        (pkg_dir / "base.py").write_text("class BasePlugin:\n    pass\n")
+        (pkg_dir / "plugin_top.py").write_text(
+            "from .base import BasePlugin\n\nclass PluginTop(BasePlugin):\n    pass\n"
+        )
+        # A package with import side effects and nothing to discover
+        side_effects = pkg_dir / "side_effects"
+        side_effects.mkdir()
+        (side_effects / "__init__.py").write_text("raise RuntimeError('imported')\n")
+        # Plain directory without __init__.py is not descended into
+        (pkg_dir / "data").mkdir()
+        (pkg_dir / "data" / "plugin_data.py").write_text("raise RuntimeError('imported')\n")
+
+        BasePlugin = importlib.import_module("test_pkg12.base").BasePlugin
+        pkg = importlib.import_module("test_pkg12")
+
+        discovered = discover_registry_classes_recursive(
+            package_path=pkg.__path__,
+            package_prefix="test_pkg12.",
+            base_class=BasePlugin,
+            exclude_modules={'base'},
+        )
+
+        assert [cls.__name__ for cls in discovered] == ['PluginTop']
+        assert "test_pkg12.side_effects" not in sys.modules
+
+    def test_zipped_package_with_failing_subpackage(self, tmp_path, isolated_sys_modules):
+        """Test that the pkgutil fallback skips subpackages that fail to import."""
+        import zipfile
+
+        archive = tmp_path / "plugins.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("test_pkg18/__init__.py", "")
+            zf.writestr("test_pkg18/base.py", BASE_SOURCE)
+            zf.writestr("test_pkg18/plugin_a.py", plugin_source("PluginA"))
+            zf.writestr("test_pkg18/broken/__init__.py", "raise RuntimeError('broken')\n")
+        sys.path.insert(0, str(archive))
         try:
-            base_module = importlib.import_module("test_pkg5.base")
-            BasePlugin = base_module.BasePlugin
-            pkg = importlib.import_module("test_pkg5")
+            BasePlugin = importlib.import_module("test_pkg18.base").BasePlugin
+            pkg = importlib.import_module("test_pkg18")
 
-            # Discover recursively
             discovered = discover_registry_classes_recursive(
                 package_path=pkg.__path__,
-                package_prefix="test_pkg5.",
+                package_prefix="test_pkg18.",
                 base_class=BasePlugin,
                 exclude_modules={'base'},
             )
 
-            # Should find both top-level and nested plugins
-            assert len(discovered) >= 2
-            names = {cls.__name__ for cls in discovered}
-            assert 'PluginTop' in names
-            assert 'PluginSub' in names
-
+            assert [cls.__name__ for cls in discovered] == ['PluginA']
         finally:
-            sys.path.remove(str(tmp_path))
-            for key in list(sys.modules.keys()):
-                if key.startswith('test_pkg5'):
-                    del sys.modules[key]
+            sys.path.remove(str(archive))
+            sys.path_importer_cache.pop(str(archive), None)
+            for name in [name for name in sys.modules if name.startswith('test_pkg18')]:
+                del sys.modules[name]
 
-    def test_deeply_nested_discovery(self, tmp_path):
+    def test_deeply_nested_discovery(self, tmp_path, isolated_sys_modules):
         """Test discovery through deeply nested package structure."""
         # Create deeply nested structure
         pkg_dir = tmp_path / "test_pkg6"
@@ -348,123 +546,231 @@ class DeepPlugin(BasePlugin):
 """
         )
 
-        sys.path.insert(0, str(tmp_path))
-        try:
-            base_module = importlib.import_module("test_pkg6.base")
-            BasePlugin = base_module.BasePlugin
-            pkg = importlib.import_module("test_pkg6")
-
-            discovered = discover_registry_classes_recursive(
-                package_path=pkg.__path__,
-                package_prefix="test_pkg6.",
-                base_class=BasePlugin,
-                exclude_modules={'base'},
-            )
+        base_module = importlib.import_module("test_pkg6.base")
+        BasePlugin = base_module.BasePlugin
+        pkg = importlib.import_module("test_pkg6")
 
-            # Should find the deeply nested plugin
-            names = {cls.__name__ for cls in discovered}
-            assert 'DeepPlugin' in names
+        discovered = discover_registry_classes_recursive(
+            package_path=pkg.__path__,
+            package_prefix="test_pkg6.",
+            base_class=BasePlugin,
+            exclude_modules={'base'},
+        )
 
-        finally:
-            sys.path.remove(str(tmp_path))
-            for key in list(sys.modules.keys()):
-                if key.startswith('test_pkg6'):
-                    del sys.modules[key]
+        # Should find the deeply nested plugin
+        names = {cls.__name__ for cls in discovered}
+        assert 'DeepPlugin' in names
 
 
-class TestEdgeCases:
-    """Test edge cases and error handling."""
+class TestDiscoverFromEntryPoints:
+    """Test entry point based discovery."""
 
-    def test_import_error_handling(self, tmp_path):
-        """Test that import errors are handled gracefully."""
-        pkg_dir = tmp_path / "test_pkg7"
+    def test_entry_points_preferred_over_scan(self, tmp_path, isolated_sys_modules):
+        """Test that classes come from entry points, falling back to a scan."""
+        pkg_dir = tmp_path / "test_pkg16"
         pkg_dir.mkdir()
         (pkg_dir / "__init__.py").write_text("")
+        (pkg_dir / "base.py").write_text("class BasePlugin:\n    pass\n")
+        (pkg_dir / "plugins.py").write_text("""
+from .base import BasePlugin
 
-        (pkg_dir / "base.py").write_text(
-            """
-class BasePlugin:
+class AdvertisedPlugin(BasePlugin):
     pass
-"""
-        )
 
-        # Module with import error
-        (pkg_dir / "broken.py").write_text(
-            """
-import nonexistent_module  # This will fail
-
-from .base import BasePlugin
+class ScannedPlugin(BasePlugin):
+    pass
 
-class BrokenPlugin(BasePlugin):
+class Unrelated:
     pass
-"""
+""")
+        dist_info = tmp_path / "test_pkg16_dist-0.1.dist-info"
+        dist_info.mkdir()
+        (dist_info / "METADATA").write_text(
+            "Metadata-Version: 2.1\nName: test-pkg16-dist\nVersion: 0.1\n"
+        )
+        (dist_info / "entry_points.txt").write_text(
+            "[test_pkg16.plugins]\n"
+            "advertised = test_pkg16.plugins:AdvertisedPlugin\n"
+            "unrelated = test_pkg16.plugins:Unrelated\n"
+            "missing = test_pkg16.nonexistent:Plugin\n"
         )
 
-        # Valid module
-        (pkg_dir / "valid.py").write_text(
-            """
-from .base import BasePlugin
+        BasePlugin = importlib.import_module("test_pkg16.base").BasePlugin
+        pkg = importlib.import_module("test_pkg16")
+        kwargs = dict(
+            package_path=pkg.__path__,
+            package_prefix="test_pkg16.",
+            base_class=BasePlugin,
+            exclude_modules={'base'},
+        )
 
-class ValidPlugin(BasePlugin):
-    pass
-"""
+        from_entry_points = discover_from_entry_points("test_pkg16.plugins", BasePlugin)
+        preferred = discover_registry_classes(
+            **kwargs, entry_point_group="test_pkg16.plugins"
+        )
+        fallback = discover_registry_classes(
+            **kwargs, entry_point_group="test_pkg16.empty"
         )
 
-        sys.path.insert(0, str(tmp_path))
-        try:
-            base_module = importlib.import_module("test_pkg7.base")
-            BasePlugin = base_module.BasePlugin
-            pkg = importlib.import_module("test_pkg7")
+        assert [cls.__name__ for cls in from_entry_points] == ['AdvertisedPlugin']
+        assert preferred == from_entry_points
+        assert {cls.__name__ for cls in fallback} == {'AdvertisedPlugin', 'ScannedPlugin'}
 
-            # Should handle import error and continue
-            discovered = discover_registry_classes(
-                package_path=pkg.__path__,
-                package_prefix="test_pkg7.",
-                base_class=BasePlugin,
-                exclude_modules={'base'},
-            )
 
-            # Should still find ValidPlugin despite broken module
-            names = {cls.__name__ for cls in discovered}
-            assert 'ValidPlugin' in names
-            assert 'BrokenPlugin' not in names
+class TestEdgeCases:
+    """Test edge cases and error handling."""
 
-        finally:
-            sys.path.remove(str(tmp_path))
-            for key in list(sys.modules.keys()):
-                if key.startswith('test_pkg7'):
-                    del sys.modules[key]
+    def test_import_error_handling(self, plugin_package_factory, isolated_sys_modules):
+        """Test that import errors are handled gracefully."""
+        plugin_package_factory("test_pkg7", {
+            "base.py": BASE_SOURCE,
+            # Module with import error
+            "broken.py": "import nonexistent_module  # This will fail\n\n" + plugin_source("BrokenPlugin"),
+            # Valid module
+            "valid.py": plugin_source("ValidPlugin"),
+        })
+
+        base_module = importlib.import_module("test_pkg7.base")
+        BasePlugin = base_module.BasePlugin
+        pkg = importlib.import_module("test_pkg7")
+
+        # Should handle import error and continue
+        discovered = discover_registry_classes(
+            package_path=pkg.__path__,
+            package_prefix="test_pkg7.",
+            base_class=BasePlugin,
+            exclude_modules={'base'},
+        )
+
+        # Should still find ValidPlugin despite broken module
+        names = {cls.__name__ for cls in discovered}
+        assert 'ValidPlugin' in names
+        assert 'BrokenPlugin' not in names
 
-    def test_empty_package(self, tmp_path):
+    def test_empty_package(self, plugin_package_factory, isolated_sys_modules):
         """Test discovery in an empty package."""
-        pkg_dir = tmp_path / "test_pkg8"
+        plugin_package_factory("test_pkg8", {"base.py": BASE_SOURCE})
+
+        base_module = importlib.import_module("test_pkg8.base")
+        BasePlugin = base_module.BasePlugin
+        pkg = importlib.import_module("test_pkg8")
+
+        discovered = discover_registry_classes(
+            package_path=pkg.__path__,
+            package_prefix="test_pkg8.",
+            base_class=BasePlugin,
+            exclude_modules={'base'},
+        )
+
+        assert len(discovered) == 0
+
+
+class TestDiscoverRegistryClassesLazy:
+    """Test discover_registry_classes_lazy function."""
+
+    def test_lazy_discovery(self, tmp_path, isolated_sys_modules):
+        """Test that classes are found without importing their modules."""
+        pkg_dir = tmp_path / "test_pkg_lazy"
         pkg_dir.mkdir()
         (pkg_dir / "__init__.py").write_text("")
+        (pkg_dir / "base.py").write_text("class BasePlugin:\n    pass\n")
+        (pkg_dir / "plugin_a.py").write_text(
+            "from . import base\n\nclass PluginA(base.BasePlugin):\n    pass\n"
+        )
+        # Subclass of a discovered class, defined in a module sorted earlier
+        (pkg_dir / "another.py").write_text(
+            "from .plugin_a import PluginA\n\nclass PluginAA(PluginA):\n    pass\n"
+            "\nclass Unrelated:\n    pass\n"
+        )
+        # Computed base: falls back to importing the module
+        (pkg_dir / "dynamic.py").write_text(
+            "from .base import BasePlugin\n\ndef make():\n    return BasePlugin\n"
+            "\nclass PluginDyn(make()):\n    pass\n"
+        )
 
-        (pkg_dir / "base.py").write_text(
-            """
-class BasePlugin:
-    pass
-"""
+        BasePlugin = importlib.import_module("test_pkg_lazy.base").BasePlugin
+        pkg = importlib.import_module("test_pkg_lazy")
+
+        refs = discover_registry_classes_lazy(
+            package_path=pkg.__path__,
+            package_prefix="test_pkg_lazy.",
+            base_class=BasePlugin,
+            exclude_modules={'base'},
         )
 
-        sys.path.insert(0, str(tmp_path))
-        try:
-            base_module = importlib.import_module("test_pkg8.base")
-            BasePlugin = base_module.BasePlugin
-            pkg = importlib.import_module("test_pkg8")
+        assert refs == [
+            LazyClassRef("test_pkg_lazy.another", "PluginAA"),
+            LazyClassRef("test_pkg_lazy.dynamic", "PluginDyn"),
+            LazyClassRef("test_pkg_lazy.plugin_a", "PluginA"),
+        ]
+        assert "test_pkg_lazy.plugin_a" not in sys.modules
+        assert "test_pkg_lazy.dynamic" in sys.modules
 
-            discovered = discover_registry_classes(
-                package_path=pkg.__path__,
-                package_prefix="test_pkg8.",
-                base_class=BasePlugin,
-                exclude_modules={'base'},
-            )
+        plugin_a = refs[2].load()
+        assert plugin_a.__name__ == "PluginA"
+        assert issubclass(plugin_a, BasePlugin)
+        assert refs[2].load() is plugin_a
+        assert refs[2].path == "test_pkg_lazy.plugin_a:PluginA"
 
-            assert len(discovered) == 0
 
-        finally:
-            sys.path.remove(str(tmp_path))
-            for key in list(sys.modules.keys()):
-                if key.startswith('test_pkg8'):
-                    del sys.modules[key]
+class TestExclusionFilter:
+    """Test the module exclusion predicate."""
+
+    def test_substring_semantics(self):
+        """Test that exclusions match any substring of the module name."""
+        is_excluded = _exclusion_filter({'base', 'registry', 'a.b'})
+        assert is_excluded('pkg.base')
+        assert is_excluded('pkg.backend_registry')
+        assert is_excluded('pkg.database')
+        assert is_excluded('pkg.a.b.c')
+        assert not is_excluded('pkg.plugin')
+
+    def test_special_characters_escaped(self):
+        """Test that exclusions are matched literally, not as regexes."""
+        is_excluded = _exclusion_filter({'x.*'})
+        assert is_excluded('pkg.x.*')
+        assert not is_excluded('pkg.xyz')
+
+    def test_no_exclusions(self):
+        """Test that an empty exclusion set needs no predicate."""
+        assert _exclusion_filter(set()) is None
+
+    def test_predicate_reused(self):
+        """Test that equal exclusion sets share one compiled predicate."""
+        assert _exclusion_filter({'base', 'registry'}) is _exclusion_filter(['registry', 'base'])
+
+
+class TestMemoizedValidator:
+    """Test memoization of validation_func results."""
+
+    def test_each_class_validated_once(self):
+        """Test that repeated validation of a class reuses the first result."""
+        calls = []
+
+        def validation_func(cls):
+            calls.append(cls)
+            return cls.__name__.startswith('Valid')
+
+        class ValidPlugin:
+            pass
+
+        class OtherPlugin:
+            pass
+
+        for _ in range(2):
+            validate = _memoized_validator(validation_func)
+            assert validate(ValidPlugin) is True
+            assert validate(OtherPlugin) is False
+
+        assert calls == [ValidPlugin, OtherPlugin]
+
+    def test_unreferenceable_predicate_passed_through(self):
+        """Test that predicates without weakref support are used as-is."""
+        class AlwaysValid:
+            __slots__ = ()
+
+            def __call__(self, cls):
+                return True
+
+        predicate = AlwaysValid()
+        assert _memoized_validator(predicate) is predicate
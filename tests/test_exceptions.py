@@ -10,16 +10,18 @@ class TestExceptions:
 
     def test_registry_error(self):
         """Test RegistryError exception."""
-        with pytest.raises(RegistryError, match="test error"):
+        with pytest.raises(RegistryError) as exc_info:
             raise RegistryError("test error")
+        assert str(exc_info.value) == "test error"
 
         # Test inheritance
         assert issubclass(RegistryError, Exception)
 
     def test_discovery_error(self):
         """Test DiscoveryError exception."""
-        with pytest.raises(DiscoveryError, match="discovery failed"):
+        with pytest.raises(DiscoveryError) as exc_info:
             raise DiscoveryError("discovery failed")
+        assert str(exc_info.value) == "discovery failed"
 
         # Test inheritance
         assert issubclass(DiscoveryError, RegistryError)
@@ -27,8 +29,9 @@ class TestExceptions:
 
     def test_cache_error(self):
         """Test CacheError exception."""
-        with pytest.raises(CacheError, match="cache failed"):
+        with pytest.raises(CacheError) as exc_info:
             raise CacheError("cache failed")
+        assert str(exc_info.value) == "cache failed"
 
         # Test inheritance
         assert issubclass(CacheError, RegistryError)
@@ -0,0 +1,71 @@
+"""Tests for metaclass_registry._home module."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from metaclass_registry import _home
+
+# The lookups never touch the filesystem, so a fake path avoids a tmp dir per test
+FAKE_HOME = str(Path('/nonexistent/home'))
+
+# The lookup is selected at import time, so tests call each one directly
+HOME_VARS = {'win32': 'USERPROFILE', 'linux': 'HOME'}
+HOME_LOOKUPS = {'win32': _home._windows_home_dir, 'linux': _home._posix_home_dir}
+
+
+@pytest.fixture(params=sorted(HOME_VARS))
+def platform(request):
+    """Platform whose home lookup is under test."""
+    return request.param
+
+
+@pytest.fixture
+def home_env(monkeypatch):
+    """Set (or with no value, unset) a platform's home variable; returns its lookup."""
+    def apply(platform, value=None):
+        var = HOME_VARS[platform]
+        if value is None:
+            monkeypatch.delenv(var, raising=False)
+        else:
+            monkeypatch.setenv(var, value)
+        return HOME_LOOKUPS[platform]
+    return apply
+
+
+class TestGetHomeDir:
+    """Test get_home_dir function."""
+
+    def test_returns_existing_directory(self):
+        """Test that the home directory exists."""
+        assert os.path.isdir(_home.get_home_dir())
+
+    def test_memoized(self, home_env):
+        """Test that the home directory is looked up once until cache_clear()."""
+        first = _home.get_home_dir()
+        for platform in HOME_VARS:
+            home_env(platform, FAKE_HOME)
+        assert _home.get_home_dir() == first
+
+        _home.get_home_dir.cache_clear()
+        assert _home.get_home_dir() == FAKE_HOME
+
+
+class TestPlatformHomeDir:
+    """Test the per-platform home directory lookups."""
+
+    def test_variable_set(self, platform, home_env, monkeypatch):
+        """Test that the platform variable is returned without calling Path.home()."""
+        def fail(cls):
+            raise AssertionError("Path.home() called")
+
+        lookup = home_env(platform, FAKE_HOME)
+        monkeypatch.setattr(Path, 'home', classmethod(fail))
+        assert lookup() == FAKE_HOME
+
+    def test_variable_unset(self, platform, home_env, monkeypatch):
+        """Test the Path.home() fallback when the platform variable is unset."""
+        lookup = home_env(platform)
+        monkeypatch.setattr(Path, 'home', classmethod(lambda cls: Path('/fallback/home')))
+        assert lookup() == str(Path('/fallback/home'))